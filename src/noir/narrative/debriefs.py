@@ -6,6 +6,7 @@ from uuid import UUID
 
 from noir.deduction.board import DeductionBoard
 from noir.deduction.validation import ValidationResult, ArrestTier
+from noir.domain.enums import RoleTag
 from noir.investigation.outcomes import ArrestResult
 from noir.truth.graph import TruthState
 from noir.util.grammar import normalize_line, normalize_lines
@@ -69,26 +70,35 @@ _CONFESSIONS = {
     ],
 }
 
-_PARTIAL_CONFESSIONS = [
-    "You're making it sound cleaner than it was. I did not plan it, it got out of hand, and I tried to hide the worst of it. That does not make it right, but that is how it went.",
-    "I went there to talk. It turned into something else, and I panicked, and the rest was damage control. I can tell you that much, but not the rest.",
-    "I did what I did, but it is not the whole story. You are missing the part that mattered to me, and I am not giving it to you.",
-    "It was messy. I made it look simple because I needed it to stop following me, and now it has followed me anyway.",
-]
-
-_DENIALS = [
-    "I did not do this. You are looking for a neat file and I do not fit it, so you are forcing the pieces. That is on you, not me.",
-    "You want a name to close a case. You are not getting it from me, because I will not carry what I did not do. You can write it down anyway.",
-    "You are chasing a story. I am not your ending, and I will not give you one.",
-    "I was not there. You can pin this on someone else if you want to, but it is not me, and you know that.",
-]
-
-_DEFLECTIONS = [
-    "Get a lawyer in here. I am done talking and you are done hearing anything useful from me.",
-    "You should be asking someone else. You already know who, but you do not want to go there.",
-    "Ask your witnesses again. They get a different story every time, and you will pick the one that fits.",
-    "You already decided. You do not need me for that, and I am not going to help you feel better about it.",
-]
+# Pools without placeholders are normalized once at import and returned as-is.
+_PARTIAL_CONFESSIONS = normalize_lines(
+    [
+        "You're making it sound cleaner than it was. I did not plan it, it got out of hand, and I tried to hide the worst of it. That does not make it right, but that is how it went.",
+        "I went there to talk. It turned into something else, and I panicked, and the rest was damage control. I can tell you that much, but not the rest.",
+        "I did what I did, but it is not the whole story. You are missing the part that mattered to me, and I am not giving it to you.",
+        "It was messy. I made it look simple because I needed it to stop following me, and now it has followed me anyway.",
+    ]
+)
+
+_DENIALS = normalize_lines(
+    [
+        "I did not do this. You are looking for a neat file and I do not fit it, so you are forcing the pieces. That is on you, not me.",
+        "You want a name to close a case. You are not getting it from me, because I will not carry what I did not do. You can write it down anyway.",
+        "You are chasing a story. I am not your ending, and I will not give you one.",
+        "I was not there. You can pin this on someone else if you want to, but it is not me, and you know that.",
+    ]
+)
+
+_DEFLECTIONS = normalize_lines(
+    [
+        "Get a lawyer in here. I am done talking and you are done hearing anything useful from me.",
+        "You should be asking someone else. You already know who, but you do not want to go there.",
+        "Ask your witnesses again. They get a different story every time, and you will pick the one that fits.",
+        "You already decided. You do not need me for that, and I am not going to help you feel better about it.",
+    ]
+)
+
+_DENIALS_AND_DEFLECTIONS = _DENIALS + _DEFLECTIONS
 
 _INTERVIEW_CONFESSION_OPENERS = [
     "All right. Put it down exactly like this.",
@@ -114,15 +124,12 @@ def _pick_case_names(
     suspect_id: UUID | None = None,
 ) -> tuple[str, str]:
     suspect_name = "the suspect"
-    victim_name = "the victim"
     if suspect_id is not None:
         suspect = truth.people.get(suspect_id)
         if suspect:
             suspect_name = suspect.name
-    victim = next(
-        (p for p in truth.people.values() if "victim" in {tag.value for tag in p.role_tags}),
-        None,
-    )
+    victim_name = "the victim"
+    victim = next((p for p in truth.people.values() if RoleTag.VICTIM in p.role_tags), None)
     if victim:
         victim_name = victim.name
     return suspect_name, victim_name
@@ -139,7 +146,7 @@ def build_interview_break_statement(
     suspect_name, victim_name = _pick_case_names(truth, suspect_id)
     if denial:
         opener = rng.choice(_INTERVIEW_DENIAL_OPENERS)
-        line = rng.choice(_DENIALS + _DEFLECTIONS)
+        line = rng.choice(_DENIALS_AND_DEFLECTIONS)
     elif partial:
         opener = rng.choice(_INTERVIEW_PARTIAL_OPENERS)
         line = rng.choice(_PARTIAL_CONFESSIONS)
@@ -165,12 +172,9 @@ def build_post_arrest_statement(
     motive = truth.case_meta.get("motive_category")
     motive_key = motive if isinstance(motive, str) else ""
     if not validation.is_correct_suspect or outcome == ArrestResult.FAILED:
-        pool = _DENIALS + _DEFLECTIONS
-        line = rng.choice(pool)
-        return normalize_lines([line.format(suspect=suspect_name, victim=victim_name)])
+        return [rng.choice(_DENIALS_AND_DEFLECTIONS)]
     if validation.tier == ArrestTier.SHAKY or outcome == ArrestResult.PARTIAL:
-        line = rng.choice(_PARTIAL_CONFESSIONS)
-        return normalize_lines([line.format(suspect=suspect_name, victim=victim_name)])
+        return [rng.choice(_PARTIAL_CONFESSIONS)]
     confession_pool = _CONFESSIONS.get(motive_key) or _CONFESSIONS.get("default", [])
     line = rng.choice(confession_pool) if confession_pool else rng.choice(_PARTIAL_CONFESSIONS)
     return normalize_lines([line.format(suspect=suspect_name, victim=victim_name)])
@@ -16,13 +16,34 @@ from noir.showrunner.tension import sustained_high
 from noir.world.state import EndgameState, WorldState
 
 
-@dataclass
+@dataclass(slots=True)
 class EndingResult:
     kind: str
     title: str
     lines: list[str]
 
 
+_FIXED_FINAL_ENDINGS: dict[str, tuple[str, str, str]] = {
+    "captured_shaky": (
+        "captured_shaky",
+        "SEASON END - CAPTURED (SHAKY)",
+        "You brought them in, but the proof stayed thin.",
+    ),
+    "raid_wrong": (
+        "defeat",
+        "SEASON END - COLLAPSE",
+        "The raid broke the arc without closing it.",
+    ),
+}
+
+_IDENTITY_LINES: dict[str, str] = {
+    "analytical": "You built cases through analysis and corroboration.",
+    "social": "You leaned on rapport and patience to move people.",
+    "coercive": "You pushed hard when the clock was loud.",
+}
+_IDENTITY_DEFAULT_LINE = "You moved between methods, never settling into one."
+
+
 def check_early_ending(world: WorldState) -> EndingResult | None:
     """Return an early ending if any trigger has armed and fired.
 
@@ -123,18 +144,8 @@ def build_final_ending(world: WorldState) -> EndingResult:
                 "SEASON END - TRIUMPHANT",
                 "You closed the arc with a clean operation and a firm case file.",
             )
-    elif base == "captured_shaky":
-        kind, title, prologue = (
-            "captured_shaky",
-            "SEASON END - CAPTURED (SHAKY)",
-            "You brought them in, but the proof stayed thin.",
-        )
-    elif base == "raid_wrong":
-        kind, title, prologue = (
-            "defeat",
-            "SEASON END - COLLAPSE",
-            "The raid broke the arc without closing it.",
-        )
+    elif base in _FIXED_FINAL_ENDINGS:
+        kind, title, prologue = _FIXED_FINAL_ENDINGS[base]
     elif arc.confronted:
         kind, title, prologue = (
             "stalemate",
@@ -187,14 +198,7 @@ def _build(*, kind: str, title: str, lines: list[str]) -> EndingResult:
 
 
 def _identity_line(world: WorldState) -> str:
-    dominant = world.campaign.identity.dominant
-    if dominant == "analytical":
-        return "You built cases through analysis and corroboration."
-    if dominant == "social":
-        return "You leaned on rapport and patience to move people."
-    if dominant == "coercive":
-        return "You pushed hard when the clock was loud."
-    return "You moved between methods, never settling into one."
+    return _IDENTITY_LINES.get(world.campaign.identity.dominant, _IDENTITY_DEFAULT_LINE)
 
 
 def _city_line(world: WorldState) -> str:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from enum import StrEnum
+from typing import Callable
 
 from noir.narrative.grammar import normalize_line
 
@@ -12,12 +13,135 @@ class GazeMode(StrEnum):
     BEHAVIORAL = "behavioral"
 
 
+_NOTE_PREFIX = "Detective note:"
+
+_WitnessFormatter = Callable[[str, str, str | None, str, list[str]], list[str]]
+_ForensicFormatter = Callable[[str, str, str | None, str | None], list[str]]
+_CctvFormatter = Callable[[str, str, str | None, str], list[str]]
+_ForensicsResultFormatter = Callable[[str, str | None, str], list[str]]
+
+
 def gaze_label(mode: GazeMode) -> str:
     if mode == GazeMode.BEHAVIORAL:
         return "Behavioral"
     return "Forensic"
 
 
+def _clean_note(note: str) -> str:
+    return normalize_line(note.removeprefix(_NOTE_PREFIX).lstrip())
+
+
+def _witness_formatter(timing_label: str, statement_label: str, note_label: str) -> _WitnessFormatter:
+    timing_prefix = f"{timing_label}: "
+    statement_prefix = f"{statement_label}: "
+    note_prefix = f"{note_label}: "
+
+    def format_lines(
+        time_phrase: str,
+        statement: str,
+        note: str | None,
+        confidence: str,
+        uncertainty_hooks: list[str],
+    ) -> list[str]:
+        lines = [
+            f"{timing_prefix}{time_phrase} (estimate)",
+            f"{statement_prefix}{normalize_line(statement)}",
+        ]
+        if note:
+            lines.append(f"{note_prefix}{_clean_note(note)}")
+        if uncertainty_hooks:
+            lines.append("Uncertainty:")
+            for hook in uncertainty_hooks:
+                lines.append(f"- {normalize_line(hook)}")
+        lines.append(f"Confidence: {confidence}")
+        return lines
+
+    return format_lines
+
+
+def _forensic_formatter(obs_label: str, tod_label: str, stage_label: str) -> _ForensicFormatter:
+    obs_prefix = f"{obs_label}: "
+    tod_prefix = f"{tod_label}: "
+    stage_prefix = f"{stage_label}: "
+
+    def format_lines(
+        observation: str,
+        confidence: str,
+        tod_phrase: str | None,
+        stage_hint: str | None,
+    ) -> list[str]:
+        lines = [f"{obs_prefix}{normalize_line(observation)}"]
+        if tod_phrase:
+            lines.append(f"{tod_prefix}{tod_phrase}")
+        if stage_hint:
+            lines.append(f"{stage_prefix}{normalize_line(stage_hint)}")
+        lines.append(f"Confidence: {confidence}")
+        return lines
+
+    return format_lines
+
+
+def _cctv_formatter(time_label: str, note_label: str, summary_label: str) -> _CctvFormatter:
+    time_prefix = f"{time_label}: "
+    note_prefix = f"{note_label}: "
+    summary_prefix = f"{summary_label}: "
+
+    def format_lines(
+        summary: str,
+        time_phrase: str,
+        note: str | None,
+        confidence: str,
+    ) -> list[str]:
+        lines = [
+            f"{summary_prefix}{normalize_line(summary)}",
+            f"{time_prefix}{time_phrase}",
+        ]
+        if note:
+            lines.append(f"{note_prefix}{_clean_note(note)}")
+        lines.append(f"Confidence: {confidence}")
+        return lines
+
+    return format_lines
+
+
+def _forensics_result_formatter(finding_label: str, method_label: str) -> _ForensicsResultFormatter:
+    finding_prefix = f"{finding_label}: "
+    method_prefix = f"{method_label}: "
+
+    def format_lines(
+        finding: str,
+        method_category: str | None,
+        confidence: str,
+    ) -> list[str]:
+        lines = [f"{finding_prefix}{normalize_line(finding)}"]
+        if method_category:
+            lines.append(f"{method_prefix}{method_category}")
+        lines.append(f"Confidence: {confidence}")
+        return lines
+
+    return format_lines
+
+
+# Formatters specialized per mode at import; any mode other than BEHAVIORAL
+# reads through the forensic lens.
+_WITNESS_FORMATTERS: dict[GazeMode, _WitnessFormatter] = {
+    GazeMode.BEHAVIORAL: _witness_formatter("Timing", "Account", "Reading"),
+    GazeMode.FORENSIC: _witness_formatter("Time window", "Observation", "Constraint"),
+}
+_FORENSIC_FORMATTERS: dict[GazeMode, _ForensicFormatter] = {
+    GazeMode.BEHAVIORAL: _forensic_formatter("Scene read", "Timing", "Condition note"),
+    GazeMode.FORENSIC: _forensic_formatter("Observation", "Estimated TOD", "Stage hint"),
+}
+_CCTV_FORMATTERS: dict[GazeMode, _CctvFormatter] = {
+    GazeMode.BEHAVIORAL: _cctv_formatter("Timing", "Read", "Capture"),
+    GazeMode.FORENSIC: _cctv_formatter("Time window", "Constraint", "Observation"),
+}
+_FORENSICS_RESULT_FORMATTERS: dict[GazeMode, _ForensicsResultFormatter] = {
+    GazeMode.BEHAVIORAL: _forensics_result_formatter("Trace read", "Method class"),
+    GazeMode.FORENSIC: _forensics_result_formatter("Finding", "Method category"),
+}
+
+
 def format_witness_lines(
     time_phrase: str,
     statement: str,
@@ -26,28 +150,8 @@ def format_witness_lines(
     uncertainty_hooks: list[str],
     mode: GazeMode,
 ) -> list[str]:
-    statement = normalize_line(statement)
-    if mode == GazeMode.BEHAVIORAL:
-        timing_label = "Timing"
-        statement_label = "Account"
-        note_label = "Reading"
-    else:
-        timing_label = "Time window"
-        statement_label = "Observation"
-        note_label = "Constraint"
-    lines = [
-        f"{timing_label}: {time_phrase} (estimate)",
-        f"{statement_label}: {statement}",
-    ]
-    if note:
-        cleaned = note.replace("Detective note:", "").strip()
-        cleaned = normalize_line(cleaned)
-        lines.append(f"{note_label}: {cleaned}")
-    if uncertainty_hooks:
-        lines.append("Uncertainty:")
-        lines.extend(f"- {normalize_line(hook)}" for hook in uncertainty_hooks)
-    lines.append(f"Confidence: {confidence}")
-    return lines
+    formatter = _WITNESS_FORMATTERS.get(mode) or _WITNESS_FORMATTERS[GazeMode.FORENSIC]
+    return formatter(time_phrase, statement, note, confidence, uncertainty_hooks)
 
 
 def format_forensic_lines(
@@ -57,24 +161,8 @@ def format_forensic_lines(
     stage_hint: str | None,
     mode: GazeMode,
 ) -> list[str]:
-    observation = normalize_line(observation)
-    if stage_hint:
-        stage_hint = normalize_line(stage_hint)
-    if mode == GazeMode.BEHAVIORAL:
-        obs_label = "Scene read"
-        tod_label = "Timing"
-        stage_label = "Condition note"
-    else:
-        obs_label = "Observation"
-        tod_label = "Estimated TOD"
-        stage_label = "Stage hint"
-    lines = [f"{obs_label}: {observation}"]
-    if tod_phrase:
-        lines.append(f"{tod_label}: {tod_phrase}")
-    if stage_hint:
-        lines.append(f"{stage_label}: {stage_hint}")
-    lines.append(f"Confidence: {confidence}")
-    return lines
+    formatter = _FORENSIC_FORMATTERS.get(mode) or _FORENSIC_FORMATTERS[GazeMode.FORENSIC]
+    return formatter(observation, confidence, tod_phrase, stage_hint)
 
 
 def format_cctv_lines(
@@ -84,25 +172,8 @@ def format_cctv_lines(
     confidence: str,
     mode: GazeMode,
 ) -> list[str]:
-    summary = normalize_line(summary)
-    if mode == GazeMode.BEHAVIORAL:
-        time_label = "Timing"
-        note_label = "Read"
-        summary_label = "Capture"
-    else:
-        time_label = "Time window"
-        note_label = "Constraint"
-        summary_label = "Observation"
-    lines = [
-        f"{summary_label}: {summary}",
-        f"{time_label}: {time_phrase}",
-    ]
-    if note:
-        cleaned = note.replace("Detective note:", "").strip()
-        cleaned = normalize_line(cleaned)
-        lines.append(f"{note_label}: {cleaned}")
-    lines.append(f"Confidence: {confidence}")
-    return lines
+    formatter = _CCTV_FORMATTERS.get(mode) or _CCTV_FORMATTERS[GazeMode.FORENSIC]
+    return formatter(summary, time_phrase, note, confidence)
 
 
 def format_forensics_result_lines(
@@ -111,15 +182,7 @@ def format_forensics_result_lines(
     confidence: str,
     mode: GazeMode,
 ) -> list[str]:
-    finding = normalize_line(finding)
-    if mode == GazeMode.BEHAVIORAL:
-        finding_label = "Trace read"
-        method_label = "Method class"
-    else:
-        finding_label = "Finding"
-        method_label = "Method category"
-    lines = [f"{finding_label}: {finding}"]
-    if method_category:
-        lines.append(f"{method_label}: {method_category}")
-    lines.append(f"Confidence: {confidence}")
-    return lines
+    formatter = (
+        _FORENSICS_RESULT_FORMATTERS.get(mode) or _FORENSICS_RESULT_FORMATTERS[GazeMode.FORENSIC]
+    )
+    return formatter(finding, method_category, confidence)
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections import deque
 from dataclasses import dataclass
-from typing import Iterable
+from itertools import accumulate
+from typing import Callable, Iterable, Sequence
 
 from noir.util.rng import Rng
-from noir.world.state import CaseRecord, EpisodeTitleState, WorldState
+from noir.world.state import EpisodeTitleState, WorldState
 from noir.narrative.grammar import normalize_line, normalize_lines, place_with_article
 from noir.narrative.styles import build_noir_phrase, build_partner_phrase
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpisodeTitle:
     text: str
     register: str
@@ -103,9 +106,22 @@ _TITLE_LIBRARY = [
     EpisodeTitle("The Pattern Has a Name", "D", ("nemesis", "reveal"), True),
 ]
 
-_USED_TITLE_IDS: set[int] = set()
-_RECENT_REGISTERS: list[str] = []
-_RECENT_TAGS: list[str] = []
+# Parallel views of the title library, built once so title picks never touch
+# the dataclass instances or rebuild tag sets.
+_TITLE_TEXTS: list[str] = [entry.text for entry in _TITLE_LIBRARY]
+_TITLE_REGISTERS: list[str] = [entry.register for entry in _TITLE_LIBRARY]
+_TITLE_TAGSETS: list[frozenset[str]] = [frozenset(entry.tags) for entry in _TITLE_LIBRARY]
+_TITLE_WEIGHTS: list[float] = [entry.weight for entry in _TITLE_LIBRARY]
+_TITLE_NEMESIS_ONLY: list[bool] = [entry.nemesis_only for entry in _TITLE_LIBRARY]
+_TITLES_BY_REGISTER: dict[str, list[int]] = {}
+for _idx, _register in enumerate(_TITLE_REGISTERS):
+    _TITLES_BY_REGISTER.setdefault(_register, []).append(_idx)
+del _idx, _register
+
+# Bitmask of title indices already used when no EpisodeTitleState is supplied.
+_USED_TITLE_BITS: int = 0
+_RECENT_REGISTERS: deque[str] = deque(maxlen=3)
+_RECENT_TAGS: deque[str] = deque(maxlen=8)
 
 
 def _allowed_registers(kind: str, rng: Rng) -> list[str]:
@@ -124,19 +140,13 @@ def _allowed_registers(kind: str, rng: Rng) -> list[str]:
     return registers
 
 
-def _weighted_choice(
-    rng: Rng, items: list[tuple[int, EpisodeTitle]], weights: list[float]
-) -> tuple[int, EpisodeTitle]:
-    total = sum(weights)
+def _weighted_choice(rng: Rng, items: list[int], weights: list[float]) -> int:
+    cumulative = list(accumulate(weights))
+    total = cumulative[-1]
     if total <= 0:
         return items[0]
     pick = rng.random() * total
-    upto = 0.0
-    for (idx, entry), weight in zip(items, weights):
-        upto += weight
-        if pick <= upto:
-            return idx, entry
-    return items[-1]
+    return items[min(bisect_left(cumulative, pick), len(items) - 1)]
 
 _COLD_OPEN_TEMPLATES = [
     "A call comes in from {place}.",
@@ -146,34 +156,57 @@ _COLD_OPEN_TEMPLATES = [
     "Tonight starts at {place}.",
 ]
 
-_END_TAGS_SUCCESS = [
-    "The report holds, for now.",
-    "The file closes clean.",
-    "The city exhales for a night.",
-]
 
-_END_TAGS_PARTIAL = [
-    "The charge stands, but it is thin.",
-    "You have a name, not a lock.",
-    "The file stays open in spirit.",
-]
+def _place_template(template: str) -> Callable[[str], str]:
+    head, _, tail = template.partition("{place}")
+    return lambda place: f"{head}{place}{tail}"
 
-_END_TAGS_FAILED = [
-    "The file stays open.",
-    "The city remembers the gap.",
-    "The night moves on without closure.",
-]
 
-_PARTNER_LINES = [
-    "Your partner keeps the room moving.",
-    "The team runs the file while you head out.",
-    "A colleague flags a thread worth pulling.",
-    "The squad room is quiet, but the phones are not.",
-    "The case file feels heavier than it looks.",
-    "Someone on the team already pulled the last report.",
-    "A partner asks for the short version, then the long one.",
-    "The unit watches the clock as the city wakes.",
-]
+# Cold-open templates pre-split around {place} so a pick skips str.format parsing.
+_COLD_OPEN_RENDERERS = [_place_template(template) for template in _COLD_OPEN_TEMPLATES]
+
+# Literal pools are normalized once at import; picks are returned unchanged.
+_END_TAGS_SUCCESS = normalize_lines(
+    [
+        "The report holds, for now.",
+        "The file closes clean.",
+        "The city exhales for a night.",
+    ]
+)
+
+_END_TAGS_PARTIAL = normalize_lines(
+    [
+        "The charge stands, but it is thin.",
+        "You have a name, not a lock.",
+        "The file stays open in spirit.",
+    ]
+)
+
+_END_TAGS_FAILED = normalize_lines(
+    [
+        "The file stays open.",
+        "The city remembers the gap.",
+        "The night moves on without closure.",
+    ]
+)
+
+_END_TAG_POOLS = {
+    "success": _END_TAGS_SUCCESS,
+    "partial": _END_TAGS_PARTIAL,
+}
+
+_PARTNER_LINES = normalize_lines(
+    [
+        "Your partner keeps the room moving.",
+        "The team runs the file while you head out.",
+        "A colleague flags a thread worth pulling.",
+        "The squad room is quiet, but the phones are not.",
+        "The case file feels heavier than it looks.",
+        "Someone on the team already pulled the last report.",
+        "A partner asks for the short version, then the long one.",
+        "The unit watches the clock as the city wakes.",
+    ]
+)
 
 
 def build_episode_title(
@@ -185,98 +218,99 @@ def build_episode_title(
     title_state: EpisodeTitleState | None = None,
 ) -> str:
     allowed = _allowed_registers(episode_kind, rng)
-    tags = tuple(dict.fromkeys(case_tags or []))
-    used_ids = _USED_TITLE_IDS
-    recent_registers = _RECENT_REGISTERS
-    recent_tags = _RECENT_TAGS
+    tag_set = frozenset(case_tags or ())
+    global _USED_TITLE_BITS
     if title_state is not None:
-        used_ids = set(title_state.used_ids)
-        recent_registers = title_state.recent_registers
-        recent_tags = title_state.recent_tags
-    candidates = []
-    for idx, entry in enumerate(_TITLE_LIBRARY):
-        if entry.register not in allowed:
-            continue
-        if entry.nemesis_only and episode_kind != "nemesis":
-            continue
-        if idx in _USED_TITLE_IDS:
-            continue
-        candidates.append((idx, entry))
+        used_bits = 0
+        for used_id in title_state.used_ids:
+            used_bits |= 1 << used_id
+        recent_registers: Sequence[str] = title_state.recent_registers[-3:]
+        recent_tags = frozenset(title_state.recent_tags[-8:])
+    else:
+        used_bits = _USED_TITLE_BITS
+        recent_registers = _RECENT_REGISTERS
+        recent_tags = frozenset(_RECENT_TAGS)
+    nemesis = episode_kind == "nemesis"
+    pools = [indices for register, indices in _TITLES_BY_REGISTER.items() if register in allowed]
+    candidates = [
+        idx
+        for indices in pools
+        for idx in indices
+        if not (used_bits >> idx) & 1 and (nemesis or not _TITLE_NEMESIS_ONLY[idx])
+    ]
     if not candidates:
-        candidates = [(idx, entry) for idx, entry in enumerate(_TITLE_LIBRARY) if entry.register in allowed]
+        candidates = [
+            idx for indices in pools for idx in indices if nemesis or not _TITLE_NEMESIS_ONLY[idx]
+        ]
     weights: list[float] = []
-    recent_registers = _RECENT_REGISTERS[-3:]
-    recent_tags = set(_RECENT_TAGS[-8:])
-    for _, entry in candidates:
-        score = entry.weight
-        if tags and set(entry.tags) & set(tags):
-            overlap = set(entry.tags) & set(tags)
-            score += 2.0 + min(2.5, 0.5 * len(overlap))
+    register_factors = {register: 1.0 for register in allowed}
+    for register in register_factors:
         if recent_registers:
-            if entry.register == recent_registers[-1]:
-                score *= 0.55
-            if entry.register in recent_registers:
-                score *= 0.75
-        if recent_tags and entry.tags:
-            overlap = set(entry.tags) & recent_tags
-            if overlap:
-                score *= max(0.45, 0.85 ** len(overlap))
-        if episode_kind == "nemesis" and entry.register == "D":
-            score *= 1.25
-        if episode_kind == "nemesis" and "recurrence" in entry.tags:
+            if register == recent_registers[-1]:
+                register_factors[register] *= 0.55
+            if register in recent_registers:
+                register_factors[register] *= 0.75
+        if nemesis and register == "D":
+            register_factors[register] *= 1.25
+    for idx in candidates:
+        entry_tags = _TITLE_TAGSETS[idx]
+        score = _TITLE_WEIGHTS[idx]
+        overlap = entry_tags & tag_set
+        if overlap:
+            score += 2.0 + min(2.5, 0.5 * len(overlap))
+        score *= register_factors[_TITLE_REGISTERS[idx]]
+        overlap = entry_tags & recent_tags
+        if overlap:
+            score *= max(0.45, 0.85 ** len(overlap))
+        if nemesis and "recurrence" in entry_tags:
             score *= 1.2
         weights.append(score)
-    chosen_index, entry = _weighted_choice(rng, candidates, weights)
+    chosen_index = _weighted_choice(rng, candidates, weights)
+    register = _TITLE_REGISTERS[chosen_index]
+    entry_tags = _TITLE_LIBRARY[chosen_index].tags
     if title_state is not None:
-        if chosen_index not in title_state.used_ids:
+        if not (used_bits >> chosen_index) & 1:
             title_state.used_ids.append(chosen_index)
-        title_state.recent_registers.append(entry.register)
-        title_state.recent_registers[:] = title_state.recent_registers[-3:]
-        title_state.recent_tags.extend(entry.tags)
-        title_state.recent_tags[:] = title_state.recent_tags[-8:]
+        title_state.recent_registers.append(register)
+        del title_state.recent_registers[:-3]
+        title_state.recent_tags.extend(entry_tags)
+        del title_state.recent_tags[:-8]
     else:
-        _USED_TITLE_IDS.add(chosen_index)
-        _RECENT_REGISTERS.append(entry.register)
-        _RECENT_REGISTERS[:] = _RECENT_REGISTERS[-3:]
-        _RECENT_TAGS.extend(entry.tags)
-        _RECENT_TAGS[:] = _RECENT_TAGS[-8:]
-    return entry.text
+        _USED_TITLE_BITS |= 1 << chosen_index
+        _RECENT_REGISTERS.append(register)
+        _RECENT_TAGS.extend(entry_tags)
+    return _TITLE_TEXTS[chosen_index]
 
 
 def build_cold_open(rng: Rng, location_name: str) -> list[str]:
-    templates = list(_COLD_OPEN_TEMPLATES)
-    rng.shuffle(templates)
-    place = place_with_article(location_name)
-    lines = [templates[0].format(place=place)]
+    render = rng.choice(_COLD_OPEN_RENDERERS)
+    lines = [normalize_line(render(place_with_article(location_name)))]
     phrase = build_noir_phrase(rng.fork("cold-open-style"))
     if phrase:
-        lines.append(phrase)
-    return normalize_lines(lines)
+        lines.append(normalize_line(phrase))
+    return lines
 
 
 def build_end_tag(rng: Rng, outcome: str) -> list[str]:
-    tag_lines: list[str] = []
-    if outcome == "success":
-        pool = _END_TAGS_SUCCESS
-    elif outcome == "partial":
-        pool = _END_TAGS_PARTIAL
-    else:
-        pool = _END_TAGS_FAILED
-    tag_lines.append(rng.choice(pool))
-    return normalize_lines(tag_lines)
+    return [rng.choice(_END_TAG_POOLS.get(outcome, _END_TAGS_FAILED))]
 
 
 def build_previously_on(world: WorldState, limit: int = 4) -> list[str]:
-    if not world.case_history:
+    history = world.case_history
+    if not history:
         return []
-    recent: Iterable[CaseRecord] = world.case_history[-limit:]
-    lines: list[str] = ["Previously on..."]
-    for record in recent:
-        note = ""
-        if record.notes:
-            note = f" {record.notes[0]}"
-        lines.append(f"Case {record.case_id} closed ({record.outcome}).{note}")
-    return normalize_lines(lines)
+    recent = history[-limit:] if len(history) > limit else history
+    return normalize_lines(
+        [
+            "Previously on...",
+            *[
+                f"Case {record.case_id} closed ({record.outcome}). {record.notes[0]}"
+                if record.notes
+                else f"Case {record.case_id} closed ({record.outcome})."
+                for record in recent
+            ],
+        ]
+    )
 
 
 def build_partner_line(rng: Rng, chance: float = 0.6) -> list[str]:
@@ -284,5 +318,5 @@ def build_partner_line(rng: Rng, chance: float = 0.6) -> list[str]:
         return []
     phrase = build_partner_phrase(rng.fork("partner-style"))
     if phrase:
-        return normalize_lines([phrase])
-    return normalize_lines([rng.choice(_PARTNER_LINES)])
+        return [normalize_line(phrase)]
+    return [rng.choice(_PARTNER_LINES)]
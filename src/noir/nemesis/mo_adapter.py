@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING
 
 from noir.util.rng import Rng
@@ -26,6 +27,8 @@ _MAX_WEIGHT = 1.9
 _MIN_COMPETENCE = 0.15
 _MAX_COMPETENCE = 0.98
 
+_SELECTION_FIELDS = attrgetter("weight", "competence", "compromised", "avoid_cooldown")
+
 _COUNTERPLAY_TONES = {
 	"aggression_feeder": "baiting",
 	"forensic_countermeasures": "sterile",
@@ -93,23 +96,20 @@ def _decay_cooldowns(state: "NemesisState") -> None:
 def _select_component(
 	state: "NemesisState", component_type: str, rng: Rng
 ) -> tuple["NemesisComponent | None", bool]:
-	candidates = [
-		component
-		for component in state.mo_components
-		if component.component_type.value == component_type
-	]
+	candidates = state.components_by_type.get(component_type)
 	if not candidates:
 		return None, False
 
 	weighted_candidates: list[tuple["NemesisComponent", float]] = []
 	for component in candidates:
-		weight = max(_MIN_WEIGHT, component.weight)
-		if component.compromised:
-			if component.avoid_cooldown > 0:
+		weight, competence, compromised, avoid_cooldown = _SELECTION_FIELDS(component)
+		weight = max(_MIN_WEIGHT, weight)
+		if compromised:
+			if avoid_cooldown > 0:
 				weight *= _COOLDOWN_WEIGHT_FACTOR
 			else:
 				weight *= _COMPROMISED_WEIGHT_FACTOR
-		weight *= 0.75 + (component.competence * 0.5)
+		weight *= 0.75 + (competence * 0.5)
 		weighted_candidates.append((component, weight))
 
 	selected = rng.weighted_choice(weighted_candidates)
@@ -261,8 +261,8 @@ def _find_component(
 	state: "NemesisState", component_type: str, value: str
 ) -> "NemesisComponent | None":
 	if value:
-		for component in state.mo_components:
-			if component.component_type.value == component_type and component.value == value:
+		for component in state.components_by_type.get(component_type, ()):
+			if component.value == value:
 				return component
 	return None
 
@@ -270,15 +270,10 @@ def _find_component(
 def _highest_weight_component(
 	state: "NemesisState", component_type: str
 ) -> "NemesisComponent | None":
-	candidates = [
-		component
-		for component in state.mo_components
-		if component.component_type.value == component_type
-	]
+	candidates = state.components_by_type.get(component_type)
 	if not candidates:
 		return None
-	candidates.sort(key=lambda component: component.weight, reverse=True)
-	return candidates[0]
+	return max(candidates, key=lambda component: component.weight)
 
 
 def _clamp(value: float, minimum: float, maximum: float) -> float:
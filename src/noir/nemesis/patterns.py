@@ -5,12 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple, Sequence
 
 import yaml
 
 from noir.util.rng import Rng
-from noir.util.grammar import normalize_line
+from noir.util.grammar import normalize_lines
 
 
 class PatternType(StrEnum):
@@ -21,6 +21,9 @@ class PatternType(StrEnum):
     BACKGROUND = "background"
 
 
+# Pattern types that reset the false-positive spacing counter.
+_FALSE_POSITIVE_TYPES = frozenset({PatternType.COPYCAT, PatternType.RED_HERRING})
+
 _LABEL_LADDER = [
     "Noted Similarity",
     "Recurring Detail",
@@ -36,8 +39,13 @@ _RED_HERRING_SOURCES = [
     "Coincidental staging or environment.",
 ]
 
+_DEGRADED_MESSAGE_STATUSES = ("Altered", "Absent")
+_RED_HERRING_STAGING_STATUSES = ("Unknown", "Inconsistent")
+_DRIFT_TARGETS = ("token", "staging", "message")
+_VISIBLE_MESSAGE_STATUSES = frozenset({"Present", "Altered"})
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Motif:
     id: int
     name: str
@@ -49,26 +57,53 @@ class Motif:
     message: str | None = None
     discoverability: list[str] = field(default_factory=list)
     copycat_risk: str = "Medium"
+    _detail: tuple[str | None, str | None] = field(
+        init=False, repr=False, compare=False, default=(None, None)
+    )
 
-    def detail_label(self) -> tuple[str | None, str | None]:
+    def __post_init__(self) -> None:
         if self.staging:
-            return "Staging", self.staging
-        if self.trace:
-            return "Trace", self.trace
-        if self.style:
-            return "Style", self.style
-        return None, None
+            detail = ("Staging", self.staging)
+        elif self.trace:
+            detail = ("Trace", self.trace)
+        elif self.style:
+            detail = ("Style", self.style)
+        else:
+            return
+        object.__setattr__(self, "_detail", detail)
+
+    def detail_label(self) -> tuple[str | None, str | None]:
+        return self._detail
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MotifObservation:
     token_status: str
     staging_status: str
     message_status: str
+    # Bit 0: token present, bit 1: staging consistent, bit 2: message present.
+    status_bits: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self) -> None:
+        bits = (
+            (self.token_status == "Present")
+            | (self.staging_status == "Consistent") << 1
+            | (self.message_status == "Present") << 2
+        )
+        object.__setattr__(self, "status_bits", bits)
+
+
+_ADDENDUM_HEADER = (
+    "CASE FILE ADDENDUM - INTERNAL NOTE",
+    "",
+    "Summary:",
+    "A detail observed in this incident resembles elements seen previously.",
+)
+
 
+class PatternAddendum(NamedTuple):
+    """Internal case-file note; line fields are stored already normalized."""
 
-@dataclass(frozen=True)
-class PatternAddendum:
     case_id: str
     label: str
     observations: list[str]
@@ -76,32 +111,19 @@ class PatternAddendum:
     action_lines: list[str]
 
     def render(self) -> list[str]:
-        lines: list[str] = [
-            "CASE FILE ADDENDUM - INTERNAL NOTE",
-            "",
-            "Summary:",
-            "A detail observed in this incident resembles elements seen previously.",
+        return [
+            *_ADDENDUM_HEADER,
             f"Status: {self.label}",
             "",
             "Observations:",
+            *[f"- {line}" for line in self.observations],
+            "",
+            "Assessment:",
+            *self.assessment_lines,
+            "",
+            "Action:",
+            *self.action_lines,
         ]
-        for line in self.observations:
-            lines.append(f"- {normalize_line(line)}")
-        lines.extend(
-            [
-                "",
-                "Assessment:",
-            ]
-        )
-        lines.extend(normalize_line(line) for line in self.assessment_lines)
-        lines.extend(
-            [
-                "",
-                "Action:",
-            ]
-        )
-        lines.extend(normalize_line(line) for line in self.action_lines)
-        return lines
 
 
 def _motif_meta(motif: Motif | None) -> dict[str, Any] | None:
@@ -131,8 +153,7 @@ def _observation_meta(observation: MotifObservation | None) -> dict[str, str] |
     }
 
 
-@dataclass(frozen=True)
-class PatternCasePlan:
+class PatternCasePlan(NamedTuple):
     case_id: str
     case_index: int
     pattern_type: PatternType
@@ -162,8 +183,15 @@ def _motifs_path() -> Path:
     return root / "assets" / "text_atoms" / "nemesis_motifs.yml"
 
 
-def _load_motifs(path: Path | None = None) -> list[Motif]:
-    motif_path = path or _motifs_path()
+_MOTIF_CACHE: dict[Path, tuple[Motif, ...]] = {}
+
+
+def _load_motifs(path: Path | None = None) -> tuple[Motif, ...]:
+    """Load the motif library once per resolved path and share it."""
+    motif_path = (path or _motifs_path()).resolve()
+    cached = _MOTIF_CACHE.get(motif_path)
+    if cached is not None:
+        return cached
     data = yaml.safe_load(motif_path.read_text(encoding="utf-8")) or {}
     motifs: list[Motif] = []
     for item in data.get("motifs", []) or []:
@@ -181,21 +209,22 @@ def _load_motifs(path: Path | None = None) -> list[Motif]:
                 copycat_risk=str(item.get("copycat_risk", "Medium")),
             )
         )
-    return motifs
+    _MOTIF_CACHE[motif_path] = tuple(motifs)
+    return _MOTIF_CACHE[motif_path]
 
 
-def _primary_motifs(motifs: list[Motif]) -> list[Motif]:
+def _primary_motifs(motifs: Sequence[Motif]) -> list[Motif]:
     return [motif for motif in motifs if motif.category != "forensic_trace"]
 
 
-def _support_motifs(motifs: list[Motif]) -> list[Motif]:
+def _support_motifs(motifs: Sequence[Motif]) -> list[Motif]:
     return [motif for motif in motifs if motif.category == "forensic_trace"]
 
 
 class PatternTracker:
     """Run-only pattern tracker for proto-nemesis hints (Phase 3D)."""
 
-    def __init__(self, rng: Rng, motifs: list[Motif]) -> None:
+    def __init__(self, rng: Rng, motifs: Sequence[Motif]) -> None:
         self._rng = rng
         self._motifs = motifs
         primary = _primary_motifs(motifs)
@@ -203,7 +232,11 @@ class PatternTracker:
         if not primary or not support:
             raise ValueError("Motif library requires primary and forensic_trace motifs.")
         self.signature_primary = rng.choice(primary)
-        self.signature_support = rng.choice([m for m in support if m.id != self.signature_primary.id])
+        primary_id = self.signature_primary.id
+        self.signature_support = rng.choice([m for m in support if m.id != primary_id])
+        excluded = {primary_id, self.signature_support.id}
+        self._background_pool = tuple(m for m in motifs if m.id not in excluded)
+        self._red_herring_pool = tuple(m for m in motifs if m.id != primary_id)
         self.signature_seen = 0
         self.background_motif: Motif | None = None
         self.background_remaining = 0
@@ -213,16 +246,29 @@ class PatternTracker:
         self.cases_since_false_positive = 0
         self.force_false_positive_next = False
         self._case_plans: dict[str, PatternCasePlan] = {}
+        self._addenda: dict[str, PatternAddendum | None] = {}
+        self._case_seeds: dict[int, int] = {}
 
     @classmethod
     def from_library(cls, rng: Rng, path: Path | None = None) -> "PatternTracker":
         return cls(rng, _load_motifs(path))
 
     def plan_case(self, case_id: str, case_index: int) -> PatternCasePlan:
-        existing = self._case_plans.get(case_id)
-        if existing:
-            return existing
-        case_rng = self._rng.fork(f"case-{case_index}")
+        plan = self._case_plans.get(case_id)
+        if plan is None:
+            plan = self._plan_new_case(case_id, case_index)
+        return plan
+
+    def _case_rng(self, case_index: int) -> Rng:
+        # Cache the derived seed, not the Rng, so every plan starts a fresh stream.
+        seed = self._case_seeds.get(case_index)
+        if seed is None:
+            seed = self._rng.fork(f"case-{case_index}").seed
+            self._case_seeds[case_index] = seed
+        return Rng(seed)
+
+    def _plan_new_case(self, case_id: str, case_index: int) -> PatternCasePlan:
+        case_rng = self._case_rng(case_index)
         pattern_type = self._decide_pattern_type(case_index, case_rng)
         if pattern_type == PatternType.NONE:
             self.cases_since_false_positive += 1
@@ -238,7 +284,7 @@ class PatternTracker:
             )
             self._case_plans[case_id] = plan
             return plan
-        if pattern_type in (PatternType.COPYCAT, PatternType.RED_HERRING):
+        if pattern_type in _FALSE_POSITIVE_TYPES:
             self.cases_since_false_positive = 0
         else:
             self.cases_since_false_positive += 1
@@ -293,18 +339,30 @@ class PatternTracker:
         return plan
 
     def record_case(self, case_id: str, case_index: int) -> PatternAddendum | None:
-        plan = self._case_plans.get(case_id)
-        if plan is None:
-            plan = self.plan_case(case_id, case_index)
+        try:
+            return self._addenda[case_id]
+        except KeyError:
+            pass
+        addendum = self._build_addendum(self.plan_case(case_id, case_index))
+        self._addenda[case_id] = addendum
+        return addendum
+
+    def _build_addendum(self, plan: PatternCasePlan) -> PatternAddendum | None:
         if plan.pattern_type == PatternType.NONE or plan.primary is None or plan.observation is None:
             return None
         motif = plan.primary
         observation = plan.observation
         support = plan.support
-        observations: list[str] = [self._motif_line(motif, observation)]
-        if support:
-            observations.append(self._support_line(support, present=plan.support_present))
-        observations.extend(self._status_lines(observation))
+        support_lines = (
+            (self._support_line(support, present=plan.support_present),) if support else ()
+        )
+        observations = [
+            self._motif_line(motif, observation),
+            *support_lines,
+            f"Token: {observation.token_status}.",
+            f"Staging: {observation.staging_status}.",
+            f"Message: {observation.message_status}.",
+        ]
 
         assessment_lines = [
             "This may indicate recurrence, imitation, or coincidence.",
@@ -319,11 +377,11 @@ class PatternTracker:
 
         action_lines = ["Continue monitoring in future cases."]
         return PatternAddendum(
-            case_id=case_id,
+            case_id=plan.case_id,
             label=plan.label or _LABEL_LADDER[0],
-            observations=observations,
-            assessment_lines=assessment_lines,
-            action_lines=action_lines,
+            observations=normalize_lines(observations),
+            assessment_lines=normalize_lines(assessment_lines),
+            action_lines=normalize_lines(action_lines),
         )
 
     def _decide_pattern_type(self, case_index: int, rng: Rng) -> PatternType:
@@ -376,14 +434,11 @@ class PatternTracker:
 
     def _background_motif(self, rng: Rng) -> Motif:
         if self.background_motif is None:
-            excluded = {self.signature_primary.id, self.signature_support.id}
-            options = [m for m in self._motifs if m.id not in excluded]
-            self.background_motif = rng.choice(options)
+            self.background_motif = rng.choice(self._background_pool)
         return self.background_motif
 
     def _red_herring_motif(self, rng: Rng) -> Motif:
-        options = [m for m in self._motifs if m.id not in {self.signature_primary.id}]
-        return rng.choice(options)
+        return rng.choice(self._red_herring_pool)
 
     def _build_observation(
         self,
@@ -399,19 +454,19 @@ class PatternTracker:
         message_status = "Present"
         if copycat:
             staging_status = "Inconsistent"
-            message_status = rng.choice(["Altered", "Absent"])
+            message_status = rng.choice(_DEGRADED_MESSAGE_STATUSES)
         if red_herring:
             token_status = "Ambiguous"
-            staging_status = rng.choice(["Unknown", "Inconsistent"])
+            staging_status = rng.choice(_RED_HERRING_STAGING_STATUSES)
             message_status = "Absent"
         if drift and rng.random() < 0.25:
-            drift_target = rng.choice(["token", "staging", "message"])
+            drift_target = rng.choice(_DRIFT_TARGETS)
             if drift_target == "token":
                 token_status = "Ambiguous"
             elif drift_target == "staging":
                 staging_status = "Inconsistent"
             else:
-                message_status = rng.choice(["Altered", "Absent"])
+                message_status = rng.choice(_DEGRADED_MESSAGE_STATUSES)
         if not motif.token:
             token_status = "Ambiguous"
         label, detail = motif.detail_label()
@@ -454,25 +509,18 @@ class PatternTracker:
         return _LABEL_LADDER[1]
 
     def _integrity_count(self, observation: MotifObservation) -> int:
-        score = 0
-        if observation.token_status == "Present":
-            score += 1
-        if observation.staging_status == "Consistent":
-            score += 1
-        if observation.message_status == "Present":
-            score += 1
-        return score
+        return observation.status_bits.bit_count()
 
     def _motif_line(self, motif: Motif, observation: MotifObservation) -> str:
-        parts: list[str] = [motif.name]
-        if motif.token:
-            parts.append(f"Token: {motif.token}")
         label, detail = motif.detail_label()
-        if detail:
-            parts.append(f"{label}: {detail}")
-        if motif.message and observation.message_status in {"Present", "Altered"}:
-            parts.append(f"Message: {motif.message}")
-        return "; ".join(parts)
+        show_message = motif.message and observation.message_status in _VISIBLE_MESSAGE_STATUSES
+        parts = (
+            motif.name,
+            f"Token: {motif.token}" if motif.token else None,
+            f"{label}: {detail}" if detail else None,
+            f"Message: {motif.message}" if show_message else None,
+        )
+        return "; ".join(part for part in parts if part is not None)
 
     def _support_line(self, motif: Motif, present: bool) -> str:
         label, detail = motif.detail_label()
@@ -480,10 +528,3 @@ class PatternTracker:
         if present:
             return f"Supporting trace: {motif.name} ({detail_text})."
         return f"Supporting trace expected: {motif.name}. Not observed."
-
-    def _status_lines(self, observation: MotifObservation) -> list[str]:
-        return [
-            f"Token: {observation.token_status}.",
-            f"Staging: {observation.staging_status}.",
-            f"Message: {observation.message_status}.",
-        ]
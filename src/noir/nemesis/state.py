@@ -23,7 +23,11 @@ class NemesisComponentType(StrEnum):
     EXIT = "exit"
 
 
-@dataclass
+_TYPOLOGY_BY_VALUE = {member.value: member for member in NemesisTypology}
+_COMPONENT_TYPE_BY_VALUE = {member.value: member for member in NemesisComponentType}
+
+
+@dataclass(slots=True)
 class NemesisComponent:
     component_type: NemesisComponentType
     value: str
@@ -33,7 +37,7 @@ class NemesisComponent:
     avoid_cooldown: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class NemesisProfile:
     typology: NemesisTypology
     signature_token: str
@@ -46,7 +50,7 @@ class NemesisProfile:
     counterplay_traits: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class NemesisCasePlan:
     is_nemesis_case: bool
     method_category: str | None = None
@@ -56,39 +60,114 @@ class NemesisCasePlan:
     component_values: dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+_NEMESIS_PROFILE_FIELDS = (
+    "typology",
+    "signature_token",
+    "signature_staging",
+    "signature_message",
+    "victimology_bias",
+    "comfort_zones",
+    "escalation_trait",
+    "failure_echo",
+    "counterplay_traits",
+)
+_NEMESIS_COMPONENT_FIELDS = (
+    "component_type",
+    "value",
+    "weight",
+    "competence",
+    "compromised",
+    "avoid_cooldown",
+)
+
+_PROFILE_DEFAULTS = {
+    "typology": NemesisTypology.VISIONARY,
+    "signature_token": "token",
+    "signature_staging": "staging",
+    "signature_message": "message",
+    "victimology_bias": "mixed",
+    "comfort_zones": (),
+    "escalation_trait": "escalate_visibility",
+    "failure_echo": None,
+    "counterplay_traits": (),
+}
+_COMPONENT_DEFAULTS = {
+    "component_type": NemesisComponentType.METHOD,
+    "value": "",
+    "weight": 1.0,
+    "competence": 0.5,
+    "compromised": False,
+    "avoid_cooldown": 0,
+}
+
+
+def _encode_profile(profile: NemesisProfile) -> dict:
+    payload = {name: getattr(profile, name) for name in _NEMESIS_PROFILE_FIELDS}
+    payload["typology"] = profile.typology.value
+    payload["comfort_zones"] = list(profile.comfort_zones)
+    payload["counterplay_traits"] = list(profile.counterplay_traits)
+    return payload
+
+
+def _encode_component(comp: NemesisComponent) -> dict:
+    payload = {name: getattr(comp, name) for name in _NEMESIS_COMPONENT_FIELDS}
+    payload["component_type"] = comp.component_type.value
+    return payload
+
+
+def _decode_profile(payload: dict) -> NemesisProfile:
+    known = payload.keys() & _PROFILE_DEFAULTS
+    data = {**_PROFILE_DEFAULTS, **{key: payload[key] for key in known}}
+    typology = _TYPOLOGY_BY_VALUE.get(data["typology"])
+    if typology is None:
+        # Unknown values still go through the enum so corrupt saves raise ValueError.
+        typology = NemesisTypology(data["typology"])
+    data["typology"] = typology
+    data["comfort_zones"] = list(data["comfort_zones"] or ())
+    data["counterplay_traits"] = list(data["counterplay_traits"] or ())
+    return NemesisProfile(**data)
+
+
+def _decode_component(payload: dict) -> NemesisComponent:
+    known = payload.keys() & _COMPONENT_DEFAULTS
+    data = {**_COMPONENT_DEFAULTS, **{key: payload[key] for key in known}}
+    component_type = _COMPONENT_TYPE_BY_VALUE.get(data["component_type"])
+    if component_type is None:
+        component_type = NemesisComponentType(data["component_type"])
+    return NemesisComponent(
+        component_type=component_type,
+        value=data["value"],
+        weight=float(data["weight"]),
+        competence=float(data["competence"]),
+        compromised=bool(data["compromised"]),
+        avoid_cooldown=int(data["avoid_cooldown"]),
+    )
+
+
+@dataclass(slots=True)
 class NemesisState:
     profile: NemesisProfile
-    mo_components: list[NemesisComponent]
+    mo_components: tuple[NemesisComponent, ...]
     exposure: int = 0
     exposure_baseline: int = 0
     cases_until_next: int = 2
     escalation_cap: int = 3
+    components_by_type: dict[str, tuple[NemesisComponent, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Held as a tuple so components_by_type cannot drift from it.
+        self.mo_components = tuple(self.mo_components)
+        grouped: dict[str, list[NemesisComponent]] = {}
+        for comp in self.mo_components:
+            grouped.setdefault(comp.component_type.value, []).append(comp)
+        self.components_by_type = {key: tuple(comps) for key, comps in grouped.items()}
 
     def to_dict(self) -> dict:
         return {
-            "profile": {
-                "typology": self.profile.typology.value,
-                "signature_token": self.profile.signature_token,
-                "signature_staging": self.profile.signature_staging,
-                "signature_message": self.profile.signature_message,
-                "victimology_bias": self.profile.victimology_bias,
-                "comfort_zones": list(self.profile.comfort_zones),
-                "escalation_trait": self.profile.escalation_trait,
-                "failure_echo": self.profile.failure_echo,
-                "counterplay_traits": list(self.profile.counterplay_traits),
-            },
-            "mo_components": [
-                {
-                    "component_type": comp.component_type.value,
-                    "value": comp.value,
-                    "weight": comp.weight,
-                    "competence": comp.competence,
-                    "compromised": comp.compromised,
-                    "avoid_cooldown": comp.avoid_cooldown,
-                }
-                for comp in self.mo_components
-            ],
+            "profile": _encode_profile(self.profile),
+            "mo_components": [_encode_component(comp) for comp in self.mo_components],
             "exposure": self.exposure,
             "exposure_baseline": self.exposure_baseline,
             "cases_until_next": self.cases_until_next,
@@ -97,31 +176,8 @@ class NemesisState:
 
     @classmethod
     def from_dict(cls, payload: dict) -> NemesisState:
-        profile_data = payload.get("profile", {})
-        profile = NemesisProfile(
-            typology=NemesisTypology(profile_data.get("typology", NemesisTypology.VISIONARY)),
-            signature_token=profile_data.get("signature_token", "token"),
-            signature_staging=profile_data.get("signature_staging", "staging"),
-            signature_message=profile_data.get("signature_message", "message"),
-            victimology_bias=profile_data.get("victimology_bias", "mixed"),
-            comfort_zones=list(profile_data.get("comfort_zones", [])),
-            escalation_trait=profile_data.get("escalation_trait", "escalate_visibility"),
-            failure_echo=profile_data.get("failure_echo"),
-            counterplay_traits=list(profile_data.get("counterplay_traits", []) or []),
-        )
-        components: list[NemesisComponent] = []
-        for entry in payload.get("mo_components", []):
-            component_type = NemesisComponentType(entry.get("component_type", "method"))
-            components.append(
-                NemesisComponent(
-                    component_type=component_type,
-                    value=entry.get("value", ""),
-                    weight=float(entry.get("weight", 1.0)),
-                    competence=float(entry.get("competence", 0.5)),
-                    compromised=bool(entry.get("compromised", False)),
-                    avoid_cooldown=int(entry.get("avoid_cooldown", 0)),
-                )
-            )
+        profile = _decode_profile(payload.get("profile", {}))
+        components = [_decode_component(entry) for entry in payload.get("mo_components", [])]
         return cls(
             profile=profile,
             mo_components=components,
@@ -169,9 +225,18 @@ _METHODS = ["sharp", "blunt", "poison"]
 _CLEANUP = ["none", "wipe", "staging", "arson"]
 _EXITS = ["walkaway", "vehicle", "misdirection"]
 
+_TYPOLOGIES = tuple(NemesisTypology)
+_COMPONENT_POOLS = (
+    (NemesisComponentType.APPROACH, _APPROACHES),
+    (NemesisComponentType.CONTROL, _CONTROLS),
+    (NemesisComponentType.METHOD, _METHODS),
+    (NemesisComponentType.CLEANUP, _CLEANUP),
+    (NemesisComponentType.EXIT, _EXITS),
+)
+
 
 def create_nemesis_state(rng: Rng, comfort_zones: list[str] | None = None) -> NemesisState:
-    typology = rng.choice(list(NemesisTypology))
+    typology = rng.choice(_TYPOLOGIES)
     profile = NemesisProfile(
         typology=typology,
         signature_token=rng.choice(_SIGNATURE_TOKENS),
@@ -181,12 +246,11 @@ def create_nemesis_state(rng: Rng, comfort_zones: list[str] | None = None) -> Ne
         comfort_zones=comfort_zones or [],
         escalation_trait=rng.choice(_ESCALATION_TRAITS),
     )
-    mo_components = []
-    mo_components.extend(_build_components(rng, NemesisComponentType.APPROACH, _APPROACHES))
-    mo_components.extend(_build_components(rng, NemesisComponentType.CONTROL, _CONTROLS))
-    mo_components.extend(_build_components(rng, NemesisComponentType.METHOD, _METHODS))
-    mo_components.extend(_build_components(rng, NemesisComponentType.CLEANUP, _CLEANUP))
-    mo_components.extend(_build_components(rng, NemesisComponentType.EXIT, _EXITS))
+    mo_components = [
+        component
+        for component_type, values in _COMPONENT_POOLS
+        for component in _build_components(rng, component_type, values)
+    ]
     _seed_weaknesses(rng, mo_components, count=2)
     return NemesisState(
         profile=profile,
@@ -244,19 +308,15 @@ def apply_nemesis_case_outcome(
 def _build_components(
     rng: Rng, component_type: NemesisComponentType, values: list[str]
 ) -> list[NemesisComponent]:
-    components: list[NemesisComponent] = []
-    for value in values:
-        weight = 0.6 + rng.random() * 1.0
-        competence = 0.35 + rng.random() * 0.55
-        components.append(
-            NemesisComponent(
-                component_type=component_type,
-                value=value,
-                weight=round(weight, 2),
-                competence=round(competence, 2),
-            )
+    return [
+        NemesisComponent(
+            component_type=component_type,
+            value=value,
+            weight=round(0.6 + rng.random(), 2),
+            competence=round(0.35 + rng.random() * 0.55, 2),
         )
-    return components
+        for value in values
+    ]
 
 
 def _seed_weaknesses(rng: Rng, components: list[NemesisComponent], count: int = 2) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from pathlib import Path
 import json
 import sqlite3
@@ -20,45 +21,201 @@ from noir.world.state import (
 )
 from noir.nemesis.state import NemesisState
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+)
+
+_RESET_TABLES = (
+    "world_state",
+    "campaign_state",
+    "episode_title_state",
+    "case_history",
+    "district_status",
+    "location_status",
+    "people_index",
+    "nemesis_state",
+)
+
+_SQL_SELECT_WORLD = (
+    "SELECT trust_level, pressure_level, tick, nemesis_exposure, memory_json "
+    "FROM world_state WHERE id = 1"
+)
+_SQL_INIT_WORLD = """
+INSERT INTO world_state (id, trust_level, pressure_level, tick, nemesis_exposure, memory_json)
+VALUES (1, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO NOTHING
+"""
+_SQL_SELECT_NEMESIS = "SELECT state_json FROM nemesis_state WHERE id = 1"
+_SQL_SELECT_TITLES = "SELECT used_ids, recent_registers, recent_tags FROM episode_title_state WHERE id = 1"
+_SQL_SELECT_CAMPAIGN = "SELECT state_json FROM campaign_state WHERE id = 1"
+_SQL_SELECT_DISTRICTS = "SELECT district, status FROM district_status"
+_SQL_SELECT_LOCATIONS = "SELECT location, status FROM location_status"
+_SQL_SELECT_PEOPLE = (
+    "SELECT person_id, name, role_tag, country_of_origin, religion_affiliation, "
+    "religion_observance, community_connectedness, created_in_case_id, "
+    "last_seen_case_id, last_seen_tick FROM people_index"
+)
+_SQL_SELECT_CASES = (
+    "SELECT case_id, seed, district, started_tick, ended_tick, outcome, trust_delta, pressure_delta, notes "
+    "FROM case_history ORDER BY ended_tick DESC"
+)
+_SQL_UPSERT_WORLD_WITH_ACTIVITY = """
+INSERT INTO world_state (
+    id,
+    trust_level,
+    pressure_level,
+    tick,
+    nemesis_exposure,
+    nemesis_activity,
+    memory_json
+)
+VALUES (1, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    trust_level = excluded.trust_level,
+    pressure_level = excluded.pressure_level,
+    tick = excluded.tick,
+    nemesis_exposure = excluded.nemesis_exposure,
+    nemesis_activity = excluded.nemesis_activity,
+    memory_json = excluded.memory_json
+"""
+_SQL_UPSERT_WORLD = """
+INSERT INTO world_state (id, trust_level, pressure_level, tick, nemesis_exposure, memory_json)
+VALUES (1, ?, ?, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    trust_level = excluded.trust_level,
+    pressure_level = excluded.pressure_level,
+    tick = excluded.tick,
+    nemesis_exposure = excluded.nemesis_exposure,
+    memory_json = excluded.memory_json
+"""
+_SQL_UPSERT_TITLES = """
+INSERT INTO episode_title_state (id, used_ids, recent_registers, recent_tags)
+VALUES (1, ?, ?, ?)
+ON CONFLICT(id) DO UPDATE SET
+    used_ids = excluded.used_ids,
+    recent_registers = excluded.recent_registers,
+    recent_tags = excluded.recent_tags
+"""
+_SQL_UPSERT_CAMPAIGN = """
+INSERT INTO campaign_state (id, state_json)
+VALUES (1, ?)
+ON CONFLICT(id) DO UPDATE SET
+    state_json = excluded.state_json
+"""
+_SQL_DELETE_DISTRICTS = "DELETE FROM district_status"
+_SQL_INSERT_DISTRICT = "INSERT INTO district_status (district, status) VALUES (?, ?)"
+_SQL_DELETE_LOCATIONS = "DELETE FROM location_status"
+_SQL_INSERT_LOCATION = "INSERT INTO location_status (location, status) VALUES (?, ?)"
+_SQL_DELETE_PEOPLE = "DELETE FROM people_index"
+_SQL_INSERT_PERSON = """
+INSERT INTO people_index (
+    person_id,
+    name,
+    role_tag,
+    country_of_origin,
+    religion_affiliation,
+    religion_observance,
+    community_connectedness,
+    created_in_case_id,
+    last_seen_case_id,
+    last_seen_tick
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_PERSON_ROW = attrgetter(
+    "person_id",
+    "name",
+    "role_tag",
+    "country_of_origin",
+    "religion_affiliation",
+    "religion_observance",
+    "community_connectedness",
+    "created_in_case_id",
+    "last_seen_case_id",
+    "last_seen_tick",
+)
+_SQL_DELETE_NEMESIS = "DELETE FROM nemesis_state"
+_SQL_INSERT_NEMESIS = "INSERT INTO nemesis_state (id, state_json) VALUES (1, ?)"
+_SQL_DATA_VERSION = "PRAGMA data_version"
+# Marks a table whose committed row is not known to this store.
+_UNSAVED = object()
+_SQL_INSERT_CASE = """
+INSERT OR REPLACE INTO case_history (
+    case_id,
+    seed,
+    district,
+    started_tick,
+    ended_tick,
+    outcome,
+    trust_delta,
+    pressure_delta,
+    notes
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+
+def _dumps_list(values: list) -> str:
+    if orjson is not None:
+        return orjson.dumps(values).decode()
+    return json.dumps(values)
+
+
+def _loads_list(text: str | None) -> list:
+    if not text:
+        return []
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _decode_notes(text: str | None) -> list[str]:
+    if text and text.startswith("["):
+        try:
+            return _loads_list(text)
+        except ValueError:
+            pass
+    # Rows written before notes were stored as JSON use a " | " separator.
+    return [note for note in (text or "").split(" | ") if note]
+
 
 class WorldStore:
     def __init__(self, path: Path) -> None:
         self.path = Path(path)
         self.conn = sqlite3.connect(self.path)
         self.conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            self.conn.execute(pragma)
         self._has_nemesis_activity = False
+        # Last rows committed per table, so unchanged tables are not rewritten.
+        self._saved_rows: dict[str, object] = {}
+        self._data_version: int | None = None
         self._ensure_schema()
 
     def close(self) -> None:
         self.conn.close()
 
     def reset_world_state(self) -> None:
+        self._saved_rows.clear()
         cur = self.conn.cursor()
-        for table in (
-            "world_state",
-            "campaign_state",
-            "episode_title_state",
-            "case_history",
-            "district_status",
-            "location_status",
-            "people_index",
-            "nemesis_state",
-        ):
+        for table in _RESET_TABLES:
             cur.execute(f"DELETE FROM {table}")
         self.conn.commit()
 
     def load_world_state(self) -> WorldState:
+        self._saved_rows.clear()
         cur = self.conn.cursor()
-        cur.execute("SELECT trust_level, pressure_level, tick, nemesis_exposure, memory_json FROM world_state WHERE id = 1")
+        cur.execute(_SQL_SELECT_WORLD)
         row = cur.fetchone()
         if row is None:
             state = WorldState()
             cur.execute(
-                """
-                INSERT INTO world_state (id, trust_level, pressure_level, tick, nemesis_exposure, memory_json)
-                VALUES (1, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO NOTHING
-                """,
+                _SQL_INIT_WORLD,
                 (state.trust, state.pressure, state.tick, state.nemesis_exposure, "{}"),
             )
             self.conn.commit()
@@ -100,7 +257,7 @@ class WorldStore:
                     timer=int(payload.get("timer", 0)),
                     mutation=payload.get("mutation", "dormant"),
                 )
-        cur.execute("SELECT state_json FROM nemesis_state WHERE id = 1")
+        cur.execute(_SQL_SELECT_NEMESIS)
         row = cur.fetchone()
         if row is not None and row["state_json"]:
             try:
@@ -110,15 +267,15 @@ class WorldStore:
                 state.nemesis_state = None
         if state.nemesis_state is not None:
             state.nemesis_exposure = state.nemesis_state.exposure
-        cur.execute("SELECT used_ids, recent_registers, recent_tags FROM episode_title_state WHERE id = 1")
+        cur.execute(_SQL_SELECT_TITLES)
         row = cur.fetchone()
         if row is not None:
             state.episode_titles = EpisodeTitleState(
-                used_ids=json.loads(row["used_ids"] or "[]"),
-                recent_registers=json.loads(row["recent_registers"] or "[]"),
-                recent_tags=json.loads(row["recent_tags"] or "[]"),
+                used_ids=_loads_list(row["used_ids"]),
+                recent_registers=_loads_list(row["recent_registers"]),
+                recent_tags=_loads_list(row["recent_tags"]),
             )
-        cur.execute("SELECT state_json FROM campaign_state WHERE id = 1")
+        cur.execute(_SQL_SELECT_CAMPAIGN)
         row = cur.fetchone()
         if row is not None and row["state_json"]:
             try:
@@ -126,20 +283,16 @@ class WorldStore:
                 state.campaign = CampaignState.from_dict(payload)
             except json.JSONDecodeError:
                 state.campaign = CampaignState()
-        cur.execute("SELECT district, status FROM district_status")
-        for entry in cur.fetchall():
+        cur.execute(_SQL_SELECT_DISTRICTS)
+        for entry in cur:
             status = DistrictStatus(entry["status"])
             state.district_status[entry["district"]] = status
-        cur.execute("SELECT location, status FROM location_status")
-        for entry in cur.fetchall():
+        cur.execute(_SQL_SELECT_LOCATIONS)
+        for entry in cur:
             status = DistrictStatus(entry["status"])
             state.location_status[entry["location"]] = status
-        cur.execute(
-            "SELECT person_id, name, role_tag, country_of_origin, religion_affiliation, "
-            "religion_observance, community_connectedness, created_in_case_id, "
-            "last_seen_case_id, last_seen_tick FROM people_index"
-        )
-        for entry in cur.fetchall():
+        cur.execute(_SQL_SELECT_PEOPLE)
+        for entry in cur:
             record = PersonRecord(
                 person_id=entry["person_id"],
                 name=entry["name"],
@@ -153,12 +306,9 @@ class WorldStore:
                 last_seen_tick=int(entry["last_seen_tick"]),
             )
             state.people_index[record.person_id] = record
-        cur.execute(
-            "SELECT case_id, seed, district, started_tick, ended_tick, outcome, trust_delta, pressure_delta, notes "
-            "FROM case_history ORDER BY ended_tick DESC"
-        )
-        for entry in cur.fetchall():
-            notes = [note for note in (entry["notes"] or "").split(" | ") if note]
+        cur.execute(_SQL_SELECT_CASES)
+        for entry in cur:
+            notes = _decode_notes(entry["notes"])
             state.case_history.append(
                 CaseRecord(
                     case_id=entry["case_id"],
@@ -175,7 +325,6 @@ class WorldStore:
         return state
 
     def save_world_state(self, state: WorldState) -> None:
-        cur = self.conn.cursor()
         nemesis_exposure = (
             state.nemesis_state.exposure if state.nemesis_state else state.nemesis_exposure
         )
@@ -218,141 +367,77 @@ class WorldStore:
             }
         )
         if self._has_nemesis_activity:
-            cur.execute(
-                """
-                INSERT INTO world_state (
-                    id,
-                    trust_level,
-                    pressure_level,
-                    tick,
-                    nemesis_exposure,
-                    nemesis_activity,
-                    memory_json
-                )
-                VALUES (1, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    trust_level = excluded.trust_level,
-                    pressure_level = excluded.pressure_level,
-                    tick = excluded.tick,
-                    nemesis_exposure = excluded.nemesis_exposure,
-                    nemesis_activity = excluded.nemesis_activity,
-                    memory_json = excluded.memory_json
-                """,
-                (
-                    state.trust,
-                    state.pressure,
-                    state.tick,
-                    nemesis_exposure,
-                    nemesis_exposure,
-                    memory_json,
-                ),
+            world_sql = _SQL_UPSERT_WORLD_WITH_ACTIVITY
+            world_row = (
+                state.trust,
+                state.pressure,
+                state.tick,
+                nemesis_exposure,
+                nemesis_exposure,
+                memory_json,
             )
         else:
-            cur.execute(
-                """
-                INSERT INTO world_state (id, trust_level, pressure_level, tick, nemesis_exposure, memory_json)
-                VALUES (1, ?, ?, ?, ?, ?)
-                ON CONFLICT(id) DO UPDATE SET
-                    trust_level = excluded.trust_level,
-                    pressure_level = excluded.pressure_level,
-                    tick = excluded.tick,
-                    nemesis_exposure = excluded.nemesis_exposure,
-                    memory_json = excluded.memory_json
-                """,
-                (state.trust, state.pressure, state.tick, nemesis_exposure, memory_json),
-            )
-        cur.execute(
-            """
-            INSERT INTO episode_title_state (id, used_ids, recent_registers, recent_tags)
-            VALUES (1, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                used_ids = excluded.used_ids,
-                recent_registers = excluded.recent_registers,
-                recent_tags = excluded.recent_tags
-            """,
-            (
-                json.dumps(state.episode_titles.used_ids),
-                json.dumps(state.episode_titles.recent_registers),
-                json.dumps(state.episode_titles.recent_tags),
+            world_sql = _SQL_UPSERT_WORLD
+            world_row = (state.trust, state.pressure, state.tick, nemesis_exposure, memory_json)
+        rows = {
+            "world_state": world_row,
+            "episode_title_state": (
+                _dumps_list(state.episode_titles.used_ids),
+                _dumps_list(state.episode_titles.recent_registers),
+                _dumps_list(state.episode_titles.recent_tags),
             ),
-        )
-        cur.execute(
-            """
-            INSERT INTO campaign_state (id, state_json)
-            VALUES (1, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                state_json = excluded.state_json
-            """,
-            (json.dumps(state.campaign.to_dict()),),
-        )
-        cur.execute("DELETE FROM district_status")
-        for district, status in state.district_status.items():
-            cur.execute(
-                "INSERT INTO district_status (district, status) VALUES (?, ?)",
-                (district, status.value),
-            )
-        cur.execute("DELETE FROM location_status")
-        for location, status in state.location_status.items():
-            cur.execute(
-                "INSERT INTO location_status (location, status) VALUES (?, ?)",
-                (location, status.value),
-            )
-        cur.execute("DELETE FROM people_index")
-        for record in state.people_index.values():
-            cur.execute(
-                """
-                INSERT INTO people_index (
-                    person_id,
-                    name,
-                    role_tag,
-                    country_of_origin,
-                    religion_affiliation,
-                    religion_observance,
-                    community_connectedness,
-                    created_in_case_id,
-                    last_seen_case_id,
-                    last_seen_tick
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    record.person_id,
-                    record.name,
-                    record.role_tag,
-                    record.country_of_origin,
-                    record.religion_affiliation,
-                    record.religion_observance,
-                    record.community_connectedness,
-                    record.created_in_case_id,
-                    record.last_seen_case_id,
-                    record.last_seen_tick,
-                ),
-            )
-        self.conn.commit()
-        cur.execute("DELETE FROM nemesis_state")
-        if state.nemesis_state is not None:
-            cur.execute(
-                "INSERT INTO nemesis_state (id, state_json) VALUES (1, ?)",
-                (json.dumps(state.nemesis_state.to_dict()),),
-            )
-        self.conn.commit()
+            "campaign_state": (json.dumps(state.campaign.to_dict()),),
+            "district_status": [
+                (district, status.value) for district, status in state.district_status.items()
+            ],
+            "location_status": [
+                (location, status.value) for location, status in state.location_status.items()
+            ],
+            "people_index": list(map(_PERSON_ROW, state.people_index.values())),
+            "nemesis_state": (
+                json.dumps(state.nemesis_state.to_dict()) if state.nemesis_state else None
+            ),
+        }
+        data_version = self.conn.execute(_SQL_DATA_VERSION).fetchone()[0]
+        if data_version != self._data_version:
+            # Another connection committed since our last save; its rows are unknown.
+            self._saved_rows.clear()
+            self._data_version = data_version
+        changed = {
+            table: value
+            for table, value in rows.items()
+            if self._saved_rows.get(table, _UNSAVED) != value
+        }
+        if not changed:
+            return
+        with self.conn:
+            cur = self.conn.cursor()
+            if "world_state" in changed:
+                cur.execute(world_sql, world_row)
+            if "episode_title_state" in changed:
+                cur.execute(_SQL_UPSERT_TITLES, changed["episode_title_state"])
+            if "campaign_state" in changed:
+                cur.execute(_SQL_UPSERT_CAMPAIGN, changed["campaign_state"])
+            if "district_status" in changed:
+                cur.execute(_SQL_DELETE_DISTRICTS)
+                cur.executemany(_SQL_INSERT_DISTRICT, changed["district_status"])
+            if "location_status" in changed:
+                cur.execute(_SQL_DELETE_LOCATIONS)
+                cur.executemany(_SQL_INSERT_LOCATION, changed["location_status"])
+            if "people_index" in changed:
+                cur.execute(_SQL_DELETE_PEOPLE)
+                cur.executemany(_SQL_INSERT_PERSON, changed["people_index"])
+            if "nemesis_state" in changed:
+                cur.execute(_SQL_DELETE_NEMESIS)
+                if changed["nemesis_state"] is not None:
+                    cur.execute(_SQL_INSERT_NEMESIS, (changed["nemesis_state"],))
+        self._saved_rows.update(changed)
 
     def record_case(self, record: CaseRecord) -> None:
-        notes = " | ".join(record.notes)
+        notes = _dumps_list(record.notes)
         cur = self.conn.cursor()
         cur.execute(
-            """
-            INSERT OR REPLACE INTO case_history (
-                case_id,
-                seed,
-                district,
-                started_tick,
-                ended_tick,
-                outcome,
-                trust_delta,
-                pressure_delta,
-                notes
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT_CASE,
             (
                 record.case_id,
                 record.seed,
@@ -433,6 +518,9 @@ class WorldStore:
             )
             """
         )
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_case_history_ended ON case_history (ended_tick DESC)"
+        )
         cur.execute(
             """
             CREATE TABLE IF NOT EXISTS district_status (
@@ -452,7 +452,7 @@ def _deserialize_presentation(payload: dict) -> PresentationCase:
 
 
 def _serialize_evidence(item) -> dict:
-	payload = item.model_dump(mode="json")
+	payload = item.to_dict()
 	payload["__type__"] = item.__class__.__name__
 	return payload
 
@@ -464,4 +464,4 @@ def _deserialize_evidence(payload: dict):
 	model = _EVIDENCE_TYPES.get(kind)
 	if model is None:
 		raise ValueError(f"Unknown evidence type in save payload: {kind}")
-	return model.model_validate(data)
+	return model.from_dict(data)
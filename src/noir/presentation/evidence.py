@@ -2,18 +2,79 @@
 
 from __future__ import annotations
 
-from typing import Tuple
+from dataclasses import dataclass, field, fields
+from enum import Enum
+from functools import lru_cache
+from types import NoneType, UnionType
+from typing import Any, Callable, Tuple, Union, get_args, get_origin, get_type_hints
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, ConfigDict, Field
-
 from noir.domain.enums import ConfidenceBand, EvidenceType
 
 
-class EvidenceItem(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-
-    id: UUID = Field(default_factory=uuid4)
+def _uuid(value: Any) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _optional(decode: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else decode(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _decoder_for(hint: Any) -> Callable[[Any], Any]:
+    origin = get_origin(hint)
+    args = get_args(hint)
+    if origin is Union or origin is UnionType:
+        inner = [arg for arg in args if arg is not NoneType]
+        if len(inner) != 1 or len(args) != 2:
+            raise TypeError(f"Unsupported evidence field type: {hint!r}")
+        return _optional(_decoder_for(inner[0]))
+    if origin is list:
+        decode_item = _decoder_for(args[0])
+        return lambda value: [decode_item(item) for item in value]
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            decode_item = _decoder_for(args[0])
+            return lambda value: tuple(decode_item(item) for item in value)
+        decoders = tuple(_decoder_for(arg) for arg in args)
+        return lambda value: tuple(
+            decode(item) for decode, item in zip(decoders, value, strict=True)
+        )
+    if hint is UUID:
+        return _uuid
+    if isinstance(hint, type) and issubclass(hint, Enum):
+        return hint
+    if hint in (int, float, bool):
+        return hint
+    if hint is str or hint is Any:
+        return _identity
+    raise TypeError(f"Unsupported evidence field type: {hint!r}")
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [_encode_value(item) for item in value]
+    return value
+
+
+@lru_cache(maxsize=None)
+def _field_codecs(cls: type) -> tuple[tuple[str, Callable[[Any], Any]], ...]:
+    # Annotations are strings under postponed evaluation; resolve them so
+    # Optional[UUID], List[UUID] and tuple[int, int] decode like their aliases.
+    hints = get_type_hints(cls)
+    return tuple((item.name, _decoder_for(hints[item.name])) for item in fields(cls))
+
+
+@dataclass(slots=True, kw_only=True)
+class EvidenceItem:
+    id: UUID = field(default_factory=uuid4)
     evidence_type: EvidenceType
     summary: str
     source: str
@@ -21,22 +82,42 @@ class EvidenceItem(BaseModel):
     confidence: ConfidenceBand
     poi_id: str | None = None
 
-
+    def to_dict(self) -> dict:
+        return {
+            name: _encode_value(getattr(self, name)) for name, _ in _field_codecs(type(self))
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> EvidenceItem:
+        codecs = _field_codecs(cls)
+        unknown = payload.keys() - {name for name, _ in codecs}
+        if unknown:
+            raise ValueError(
+                f"Unknown fields for {cls.__name__}: {', '.join(sorted(unknown))}"
+            )
+        return cls(
+            **{name: decode(payload[name]) for name, decode in codecs if name in payload}
+        )
+
+
+@dataclass(slots=True, kw_only=True)
 class WitnessStatement(EvidenceItem):
     witness_id: UUID
     statement: str
     reported_time_window: Tuple[int, int]
     location_id: UUID
-    observed_person_ids: list[UUID] = Field(default_factory=list)
-    uncertainty_hooks: list[str] = Field(default_factory=list)
+    observed_person_ids: list[UUID] = field(default_factory=list)
+    uncertainty_hooks: list[str] = field(default_factory=list)
 
 
+@dataclass(slots=True, kw_only=True)
 class CCTVReport(EvidenceItem):
     location_id: UUID
     observed_person_ids: list[UUID]
     time_window: Tuple[int, int]
 
 
+@dataclass(slots=True, kw_only=True)
 class ForensicsResult(EvidenceItem):
     item_id: UUID
     finding: str
@@ -45,6 +126,7 @@ class ForensicsResult(EvidenceItem):
     location_id: UUID | None = None
 
 
+@dataclass(slots=True, kw_only=True)
 class ForensicObservation(EvidenceItem):
     observation: str
     tod_window: Tuple[int, int] | None = None
@@ -53,9 +135,8 @@ class ForensicObservation(EvidenceItem):
     location_id: UUID | None = None
 
 
-class PresentationCase(BaseModel):
-    model_config = ConfigDict(extra="forbid")
-
+@dataclass(slots=True, kw_only=True)
+class PresentationCase:
     case_id: str
     seed: int
     evidence: list[EvidenceItem]
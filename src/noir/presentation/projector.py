@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any, List
+from bisect import bisect_left
+from itertools import accumulate
+import re
+from typing import Any, Iterable, List, NamedTuple
 from uuid import UUID
 
 from noir.domain.enums import ConfidenceBand, EvidenceType, EventKind, ItemType, RoleTag
@@ -42,13 +45,13 @@ def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
 
 
+_HOUR_LABELS = tuple(
+    f"{hour % 12 or 12}{'am' if hour < 12 else 'pm'}" for hour in range(24)
+)
+
+
 def _format_hour(hour: int) -> str:
-    value = hour % 24
-    suffix = "am" if value < 12 else "pm"
-    display = value % 12
-    if display == 0:
-        display = 12
-    return f"{display}{suffix}"
+    return _HOUR_LABELS[hour % 24]
 
 
 def _format_time_phrase(window: tuple[int, int]) -> str:
@@ -59,13 +62,13 @@ def _format_time_phrase(window: tuple[int, int]) -> str:
 
 
 def _poi_name(poi_id: str) -> str:
-    parts = poi_id.split(":")
-    if len(parts) >= 2:
-        return parts[1]
-    return poi_id
+    _, sep, rest = poi_id.partition(":")
+    if not sep:
+        return poi_id
+    return rest.partition(":")[0]
 
 
-_LOG_POI_NAMES = {
+_LOG_POI_NAMES = frozenset({
     "logbook",
     "register",
     "receipt_bin",
@@ -84,76 +87,117 @@ _LOG_POI_NAMES = {
     "mail_area",
     "gate",
     "entry_gate",
-}
+})
 
-_CCTV_POI_NAMES = {
+_CCTV_POI_NAMES = frozenset({
     "monitor",
     "security_desk",
     "reception",
     "front_office",
     "front_desk",
-}
+})
+
+
+_LOG_TRIGGER_TAGS = frozenset({"security", "service"})
+_CCTV_TRIGGER_TAGS = frozenset({"security"})
+
+_POI_LOG = 1
+_POI_CCTV = 2
+
+
+def _poi_kind(name: str, tags: frozenset[str]) -> int:
+    """Classify a POI as a log and/or CCTV source as a bitmask."""
+    kind = 0
+    if name in _LOG_POI_NAMES or not _LOG_TRIGGER_TAGS.isdisjoint(tags):
+        kind |= _POI_LOG
+    if name in _CCTV_POI_NAMES or not _CCTV_TRIGGER_TAGS.isdisjoint(tags):
+        kind |= _POI_CCTV
+    return kind
+
+
+class ArchetypeView(NamedTuple):
+    presence_curve: dict[str, Any]
+    visibility: dict[str, Any]
+    surveillance: dict[str, Any]
+    logs: list[Any]
+    log_sources: tuple[str, ...]
+    cctv_weight: float
 
 
-def _is_log_poi(poi_id: str, tags: list[str]) -> bool:
-    name = _poi_name(poi_id)
-    if name in _LOG_POI_NAMES:
-        return True
-    if "security" in tags or "service" in tags:
-        return True
-    return False
+_EMPTY_VIEW = ArchetypeView({}, {}, {}, [], (), 0.0)
+_ARCHETYPE_INDEX: dict[str, ArchetypeView] = {}
+_ARCHETYPE_INDEX_SOURCE: dict[str, Any] | None = None
 
 
-def _is_cctv_poi(poi_id: str, tags: list[str]) -> bool:
-    name = _poi_name(poi_id)
-    if name in _CCTV_POI_NAMES:
-        return True
-    if "security" in tags:
-        return True
-    return False
+def _archetype_view(data: dict[str, Any]) -> ArchetypeView:
+    surveillance = data.get("surveillance", {}) or {}
+    logs = data.get("logs", []) or []
+    return ArchetypeView(
+        presence_curve=data.get("presence_curve", {}) or {},
+        visibility=data.get("visibility", {}) or {},
+        surveillance=surveillance,
+        logs=logs,
+        log_sources=tuple(source for source in logs if isinstance(source, str)),
+        cctv_weight=float(surveillance.get("cctv", 0.0)),
+    )
+
+
+def _archetype_index(profiles: dict[str, Any]) -> dict[str, ArchetypeView]:
+    """Flatten archetype profiles once per loaded profile set."""
+    global _ARCHETYPE_INDEX, _ARCHETYPE_INDEX_SOURCE
+    if _ARCHETYPE_INDEX_SOURCE is not profiles:
+        _ARCHETYPE_INDEX = {
+            name: _archetype_view(data) for name, data in profiles["archetypes"].items()
+        }
+        _ARCHETYPE_INDEX_SOURCE = profiles
+    return _ARCHETYPE_INDEX
+
+
+_POISON_METHOD = re.compile("poison", re.IGNORECASE)
+_BLUNT_METHOD = re.compile("blunt|bat|hammer", re.IGNORECASE)
 
 
 def _method_category_from_item(name: str) -> str:
-    lowered = name.lower()
-    if "poison" in lowered:
+    if _POISON_METHOD.search(name):
         return "poison"
-    if "blunt" in lowered or "bat" in lowered or "hammer" in lowered:
+    if _BLUNT_METHOD.search(name):
         return "blunt"
     return "sharp"
 
 
+_BUCKET_BY_HOUR = tuple(
+    "morning" if 5 <= hour < 12
+    else "afternoon" if 12 <= hour < 17
+    else "evening" if 17 <= hour < 21
+    else "midnight"
+    for hour in range(24)
+)
+
+_DOWNGRADE = {
+    ConfidenceBand.STRONG: ConfidenceBand.MEDIUM,
+    ConfidenceBand.MEDIUM: ConfidenceBand.WEAK,
+}
+
+
 def _time_bucket(hour: int) -> str:
-    value = hour % 24
-    if 5 <= value < 12:
-        return "morning"
-    if 12 <= value < 17:
-        return "afternoon"
-    if 17 <= value < 21:
-        return "evening"
-    return "midnight"
+    return _BUCKET_BY_HOUR[hour % 24]
 
 
 def _downgrade(confidence: ConfidenceBand) -> ConfidenceBand:
-    if confidence == ConfidenceBand.STRONG:
-        return ConfidenceBand.MEDIUM
-    if confidence == ConfidenceBand.MEDIUM:
-        return ConfidenceBand.WEAK
-    return confidence
+    return _DOWNGRADE.get(confidence, confidence)
 
 
 def _weighted_choice(rng: Rng, options: dict[str, float]) -> str | None:
     if not options:
         return None
-    total = sum(max(0.0, value) for value in options.values())
+    keys = tuple(options)
+    weights = [max(0.0, value) for value in options.values()]
+    total = sum(weights)
     if total <= 0:
-        return rng.choice(list(options.keys()))
+        return rng.choice(keys)
     pick = rng.random() * total
-    cumulative = 0.0
-    for key, weight in options.items():
-        cumulative += max(0.0, weight)
-        if pick <= cumulative:
-            return key
-    return next(iter(options.keys()))
+    index = bisect_left(list(accumulate(weights)), pick)
+    return keys[index] if index < len(keys) else keys[0]
 
 
 def _uuid_from(value: object) -> UUID | None:
@@ -181,23 +225,30 @@ def _signature_meta(truth: TruthState) -> dict[str, str] | None:
     return None
 
 
+_VOWEL_STARTERS = frozenset("aeiouAEIOU")
+
+
 def _article_for(value: str) -> str:
-    if not value:
-        return "A"
-    return "An" if value[0].lower() in "aeiou" else "A"
+    return "An" if value and value[0] in _VOWEL_STARTERS else "A"
+
+
+_TOKEN_DOUBTFUL = frozenset({"Ambiguous", "Absent"})
+_STAGING_DOUBTFUL = frozenset({"Inconsistent", "Unknown"})
+_MESSAGE_DOUBTFUL = frozenset({"Altered", "Absent"})
+
+
+_BANDS_BY_LEVEL = (ConfidenceBand.WEAK, ConfidenceBand.MEDIUM, ConfidenceBand.STRONG)
 
 
 def _pattern_confidence(observation: dict[str, str] | None) -> ConfidenceBand:
-    confidence = ConfidenceBand.MEDIUM
     if not observation:
-        return confidence
-    if observation.get("token_status") in {"Ambiguous", "Absent"}:
-        confidence = _downgrade(confidence)
-    if observation.get("staging_status") in {"Inconsistent", "Unknown"}:
-        confidence = _downgrade(confidence)
-    if observation.get("message_status") in {"Altered", "Absent"}:
-        confidence = _downgrade(confidence)
-    return confidence
+        return ConfidenceBand.MEDIUM
+    drops = (
+        (observation.get("token_status") in _TOKEN_DOUBTFUL)
+        + (observation.get("staging_status") in _STAGING_DOUBTFUL)
+        + (observation.get("message_status") in _MESSAGE_DOUBTFUL)
+    )
+    return _BANDS_BY_LEVEL[max(1 - drops, 0)]
 
 
 def _pattern_primary_observation(
@@ -277,9 +328,9 @@ def _false_lead_window(crime_time: int, rng: Rng) -> tuple[int, int]:
 
 
 def _confidence_rank(confidence: ConfidenceBand) -> int:
-    if confidence == ConfidenceBand.STRONG:
+    if confidence is ConfidenceBand.STRONG:
         return 3
-    if confidence == ConfidenceBand.MEDIUM:
+    if confidence is ConfidenceBand.MEDIUM:
         return 2
     return 1
 
@@ -293,7 +344,7 @@ def _offender_direct_confidence(truth: TruthState, evidence: list) -> Confidence
         return None
     strongest: ConfidenceBand | None = None
     for item in evidence:
-        seen = getattr(item, "observed_person_ids", [])
+        seen = getattr(item, "observed_person_ids", ())
         if offender.id not in seen:
             continue
         confidence = getattr(item, "confidence", ConfidenceBand.WEAK)
@@ -302,6 +353,21 @@ def _offender_direct_confidence(truth: TruthState, evidence: list) -> Confidence
     return strongest
 
 
+def _offender_and_witnesses(truth: TruthState) -> tuple[Any, list]:
+    """Return the first offender and every witness from one pass over people."""
+    offender_tag = RoleTag.OFFENDER
+    witness_tag = RoleTag.WITNESS
+    offender = None
+    witnesses = []
+    for person in truth.people.values():
+        role_tags = person.role_tags
+        if offender is None and offender_tag in role_tags:
+            offender = person
+        if witness_tag in role_tags:
+            witnesses.append(person)
+    return offender, witnesses
+
+
 def _ensure_real_suspect_trail(
     truth: TruthState,
     evidence: list,
@@ -312,14 +378,8 @@ def _ensure_real_suspect_trail(
 ) -> None:
     if _offender_direct_confidence(truth, evidence) is not None:
         return
-    offender = next(
-        (person for person in truth.people.values() if RoleTag.OFFENDER in person.role_tags),
-        None,
-    )
-    witness = next(
-        (person for person in truth.people.values() if RoleTag.WITNESS in person.role_tags),
-        None,
-    )
+    offender, witnesses = _offender_and_witnesses(truth)
+    witness = witnesses[0] if witnesses else None
     if offender is None or witness is None:
         return
     window = _false_lead_window(crime_time, rng)
@@ -350,25 +410,19 @@ def _reinforce_real_suspect_trail(
     location_name: str,
     crime_time: int,
 ) -> None:
-    if _offender_direct_confidence(truth, evidence) != ConfidenceBand.WEAK:
+    if _offender_direct_confidence(truth, evidence) is not ConfidenceBand.WEAK:
         return
-    offender = next(
-        (person for person in truth.people.values() if RoleTag.OFFENDER in person.role_tags),
-        None,
-    )
+    offender, witnesses = _offender_and_witnesses(truth)
     if offender is None:
         return
-    witnesses = sorted(
-        (person for person in truth.people.values() if RoleTag.WITNESS in person.role_tags),
-        key=lambda person: person.name,
-    )
+    witnesses.sort(key=lambda person: person.name)
     if not witnesses:
         return
     linked_witness_ids = {
         item.witness_id
         for item in evidence
         if isinstance(item, WitnessStatement)
-        and offender.id in getattr(item, "observed_person_ids", [])
+        and offender.id in getattr(item, "observed_person_ids", ())
     }
     witness = next((person for person in witnesses if person.id not in linked_witness_ids), None)
     if witness is None:
@@ -420,7 +474,7 @@ def _false_lead_confidence(
     strongest_offender_confidence: ConfidenceBand | None,
     strong_false_trail: bool,
 ) -> ConfidenceBand:
-    if strongest_offender_confidence == ConfidenceBand.STRONG and strong_false_trail:
+    if strongest_offender_confidence is ConfidenceBand.STRONG and strong_false_trail:
         return ConfidenceBand.MEDIUM
     return ConfidenceBand.WEAK
 
@@ -434,7 +488,7 @@ def _choose_false_lead_target(
     for item in evidence:
         if getattr(item, "location_id", None) != primary_location_id:
             continue
-        if getattr(item, "observed_person_ids", []):
+        if getattr(item, "observed_person_ids", ()):
             continue
         if isinstance(item, CCTVReport):
             candidates.append((("cctv", item), 1.0))
@@ -532,45 +586,102 @@ def _inject_false_lead(
     truth.case_meta["red_herring_medium"] = medium
 
 
+_RIGOR_STAGES = (
+    ("Rigor is beginning.",) * 4
+    + ("Rigor is established.",) * 5
+    + ("Rigor is fading.",)
+)
+
+
 def _rigor_stage(hours_since: int) -> str:
-    if hours_since <= 3:
-        return "Rigor is beginning."
-    if hours_since <= 8:
-        return "Rigor is established."
-    return "Rigor is fading."
+    return _RIGOR_STAGES[min(max(hours_since, 0), len(_RIGOR_STAGES) - 1)]
+
+
+# Each group contributes once, however many of its tags are present.
+_TOD_SIGMA_DELTAS: tuple[tuple[frozenset[str], float], ...] = (
+    (frozenset({"outdoor", "open"}), 0.9),
+    (frozenset({"transit"}), 0.5),
+    (frozenset({"nightlife", "roadside"}), 0.4),
+    (frozenset({"industrial", "service"}), 0.5),
+    (frozenset({"commercial"}), 0.2),
+    (frozenset({"public"}), 0.3),
+    (frozenset({"private"}), -0.2),
+    (frozenset({"interior"}), -0.2),
+    (frozenset({"lodging", "residential", "medical"}), -0.3),
+    (frozenset({"institution"}), -0.2),
+)
 
 
-def _tod_sigma(tags: list[str]) -> float:
+def _tod_sigma(tags: Iterable[str]) -> float:
     sigma = 1.5
-    if "outdoor" in tags or "open" in tags:
-        sigma += 0.9
-    if "transit" in tags:
-        sigma += 0.5
-    if "nightlife" in tags or "roadside" in tags:
-        sigma += 0.4
-    if "industrial" in tags or "service" in tags:
-        sigma += 0.5
-    if "commercial" in tags:
-        sigma += 0.2
-    if "public" in tags:
-        sigma += 0.3
-    if "private" in tags:
-        sigma -= 0.2
-    if "interior" in tags:
-        sigma -= 0.2
-    if "lodging" in tags or "residential" in tags or "medical" in tags:
-        sigma -= 0.3
-    if "institution" in tags:
-        sigma -= 0.2
+    for group, delta in _TOD_SIGMA_DELTAS:
+        if not group.isdisjoint(tags):
+            sigma += delta
     return _clamp(sigma, 0.8, 3.0)
 
 
+_WOUND_BY_METHOD = {"blunt": "laceration", "poison": "no_obvious_trauma"}
+
+
 def _wound_class(method_category: str) -> str:
-    if method_category == "blunt":
-        return "laceration"
-    if method_category == "poison":
-        return "no_obvious_trauma"
-    return "incision"
+    return _WOUND_BY_METHOD.get(method_category, "incision")
+
+
+_WOUND_OBSERVATION = {
+    "no_obvious_trauma": "No obvious external trauma is visible at first glance.",
+    "laceration": "Irregular tearing and tissue bridging suggest blunt trauma.",
+}
+_SHARP_WOUND_OBSERVATION = "Clean margins suggest a sharp instrument."
+
+_ENTRY_OBSERVATION = {
+    "forced_entry": "Scuffing and damage suggest forced entry.",
+    "trusted_contact": "No clear signs of forced entry; access may have been granted.",
+}
+_ROUTINE_ENTRY_OBSERVATION = "Entry appears routine; no immediate signs of force."
+_APPROACH_ENTRY_OBSERVATION = {
+    "lure": "No clear signs of forced entry; the victim may have been drawn into routine contact.",
+    "ambush": "No clear signs of forced entry; timing and surprise may have mattered more than force.",
+}
+
+_EXTRA_NOTES = (
+    "Light scuffing suggests recent movement.",
+    "A faint smear indicates contact with a surface.",
+    "Dust displacement suggests something was moved.",
+    "Small debris points to hurried movement.",
+)
+
+
+_WITNESS_SIGMA = {"intimate": 3.0, "acquaintance": 2.0}
+_CLOSE_TIES = frozenset({"intimate", "acquaintance"})
+
+
+def _witness_see_chance(
+    see_chance: float,
+    close_tie: bool,
+    risk_tolerance: float,
+    control_style: str,
+    exit_style: str,
+    cctv_available: bool,
+) -> float:
+    if close_tie:
+        see_chance += 0.1
+    if risk_tolerance >= 0.6:
+        see_chance += 0.1
+    if control_style == "restraints":
+        see_chance += 0.07
+    elif control_style == "surprise":
+        see_chance -= 0.1
+    elif control_style == "intimidation":
+        see_chance -= 0.03
+    if exit_style == "walkaway":
+        see_chance += 0.12
+    elif exit_style == "vehicle":
+        see_chance -= 0.05
+    elif exit_style == "misdirection":
+        see_chance -= 0.08
+    if cctv_available:
+        see_chance -= 0.1
+    return _clamp(see_chance, 0.1, 0.85)
 
 
 def _control_statement(
@@ -580,8 +691,8 @@ def _control_statement(
     offender_name: str | None,
     observed: bool,
 ) -> str:
-    heard_prefix = "I think I heard" if confidence == ConfidenceBand.WEAK else "I heard"
-    saw_prefix = "I think I saw" if confidence == ConfidenceBand.WEAK else "I saw"
+    heard_prefix = "I think I heard" if confidence is ConfidenceBand.WEAK else "I heard"
+    saw_prefix = "I think I saw" if confidence is ConfidenceBand.WEAK else "I saw"
     if observed and offender_name:
         if control_style == "restraints":
             return f"{saw_prefix} {offender_name} keeping close control of someone outside {place}."
@@ -622,65 +733,78 @@ def _control_uncertainty_hooks(control_style: str) -> list[str]:
 def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
     evidence: List = []
 
-    kill_events = [event for event in truth.events.values() if event.kind == EventKind.KILL]
-    if not kill_events:
+    kill_event = None
+    discovery_event = None
+    for event in truth.events.values():
+        if event.kind is EventKind.KILL:
+            if kill_event is None or event.timestamp < kill_event.timestamp:
+                kill_event = event
+        elif event.kind is EventKind.DISCOVERY:
+            if discovery_event is None or event.timestamp < discovery_event.timestamp:
+                discovery_event = event
+    if kill_event is None:
         return PresentationCase(case_id=truth.case_id, seed=truth.seed, evidence=[])
-    kill_event = sorted(kill_events, key=lambda e: e.timestamp)[0]
-    discovery_events = [event for event in truth.events.values() if event.kind == EventKind.DISCOVERY]
+    t0 = kill_event.timestamp
+    t1 = t0 + 1
+    t2 = t0 + 2
+    kill_location_id = kill_event.location_id
+    cctv_window = (t0 - 1, t1)
+    cctv_partial_window = (t0 - 2, t2)
     discovery_time = (
-        sorted(discovery_events, key=lambda e: e.timestamp)[0].timestamp
-        if discovery_events
-        else kill_event.timestamp + 2
+        discovery_event.timestamp if discovery_event is not None else t2
     )
 
     location_entries = truth.case_meta.get("locations")
     if not isinstance(location_entries, list) or not location_entries:
         location_entries = [
             {
-                "location_id": str(kill_event.location_id),
+                "location_id": str(kill_location_id),
                 "archetype_id": truth.case_meta.get("location_archetype"),
                 "scene_layout": truth.case_meta.get("scene_layout"),
                 "role": "primary",
             }
         ]
-    primary_entry = None
-    for entry in location_entries:
-        entry_id = _uuid_from(entry.get("location_id"))
-        if entry_id and entry_id == kill_event.location_id:
-            primary_entry = entry
-            break
+    entry_location_ids = [_uuid_from(entry.get("location_id")) for entry in location_entries]
+    entries_by_id: dict[UUID, dict] = {}
+    for entry, entry_id in zip(location_entries, entry_location_ids):
+        if entry_id:
+            entries_by_id.setdefault(entry_id, entry)
+    primary_entry = entries_by_id.get(kill_location_id)
     if primary_entry is None:
         primary_entry = next(
             (entry for entry in location_entries if entry.get("role") == "primary"),
             location_entries[0],
         )
 
-    primary_location_id = _uuid_from(primary_entry.get("location_id")) or kill_event.location_id
+    primary_location_id = _uuid_from(primary_entry.get("location_id")) or kill_location_id
     location = truth.locations.get(primary_location_id)
     cctv_available = bool(location and "cctv" in location.tags)
     location_archetype = primary_entry.get("archetype_id") or truth.case_meta.get("location_archetype")
     profiles = load_location_profiles()
-    archetype = profiles["archetypes"].get(location_archetype, {}) if location_archetype else {}
-    presence_curve = archetype.get("presence_curve", {}) or {}
-    visibility = archetype.get("visibility", {}) or {}
-    surveillance = archetype.get("surveillance", {}) or {}
-    logs = archetype.get("logs", []) or []
+    archetype_index = _archetype_index(profiles)
+    view = archetype_index.get(location_archetype, _EMPTY_VIEW) if location_archetype else _EMPTY_VIEW
+    presence_curve = view.presence_curve
+    visibility = view.visibility
     scene_layout = primary_entry.get("scene_layout") or truth.case_meta.get("scene_layout") or {}
     scene_pois = scene_layout.get("pois", []) or []
-    poi_ids = [poi.get("poi_id") for poi in scene_pois if poi.get("poi_id")]
-    poi_zone = {
-        poi.get("poi_id"): poi.get("zone_id") for poi in scene_pois if poi.get("poi_id")
-    }
-    poi_tags = {
-        poi.get("poi_id"): poi.get("tags", [])
-        for poi in scene_pois
-        if poi.get("poi_id")
-    }
-    poi_labels = {
-        poi.get("poi_id"): poi.get("label")
-        for poi in scene_pois
-        if poi.get("poi_id")
-    }
+    poi_ids: list[str] = []
+    poi_zone: dict[str, Any] = {}
+    poi_tagsets: dict[str, frozenset[str]] = {}
+    poi_labels: dict[str, Any] = {}
+    poi_names: dict[str, str] = {}
+    poi_kind: dict[str, int] = {}
+    for poi in scene_pois:
+        poi_id = poi.get("poi_id")
+        if not poi_id:
+            continue
+        tags = frozenset(poi.get("tags") or ())
+        name = _poi_name(poi_id)
+        poi_ids.append(poi_id)
+        poi_zone[poi_id] = poi.get("zone_id")
+        poi_tagsets[poi_id] = tags
+        poi_labels[poi_id] = poi.get("label")
+        poi_names[poi_id] = name
+        poi_kind[poi_id] = _poi_kind(name, tags)
     primary_poi_id = primary_entry.get("primary_poi_id") or truth.case_meta.get("primary_poi_id")
     body_poi_id = primary_entry.get("body_poi_id") or truth.case_meta.get("body_poi_id") or primary_poi_id
     if not body_poi_id and poi_ids:
@@ -696,7 +820,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
     tod_poi_id = body_poi_id or primary_poi_id
     entry_poi_id = non_body_poi_ids[0] if non_body_poi_ids else (body_poi_id or primary_poi_id)
 
-    bucket = _time_bucket(kill_event.timestamp)
+    bucket = _time_bucket(t0)
     presence = float(presence_curve.get(bucket, 0.5))
     visibility_score = (
         float(visibility.get("lighting", 0.5))
@@ -704,10 +828,8 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
         + (1.0 - float(visibility.get("noise", 0.5)))
     ) / 3.0
 
-    offender = next(
-        (person for person in truth.people.values() if RoleTag.OFFENDER in person.role_tags),
-        None,
-    )
+    offender, witnesses = _offender_and_witnesses(truth)
+    witnesses.sort(key=lambda person: person.name)
     competence = _float_trait(offender, "competence", 0.5)
     risk_tolerance = _float_trait(offender, "risk_tolerance", 0.5)
     access_path = truth.case_meta.get("access_path", "")
@@ -719,59 +841,47 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
     if kill_event.metadata and "method_category" in kill_event.metadata:
         method_category = str(kill_event.metadata.get("method_category"))
 
-    witnesses = sorted(
-        (person for person in truth.people.values() if RoleTag.WITNESS in person.role_tags),
-        key=lambda person: person.name,
-    )
     if witnesses:
+        offender_id = offender.id if offender else None
+        offender_name = offender.name if offender else None
+        place = place_with_article(location.name if location else "building")
+        offender_visible = offender is not None and presence >= 0.25
+        if offender_visible:
+            see_chance_by_tie = {
+                close_tie: _witness_see_chance(
+                    presence * visibility_score,
+                    close_tie,
+                    risk_tolerance,
+                    control_style,
+                    exit_style,
+                    cctv_available,
+                )
+                for close_tie in (False, True)
+            }
         for witness_index, witness in enumerate(witnesses):
             witness_rng = rng.fork(f"witness:{witness_index}:{witness.name}")
             relation = (
-                truth.relationship_between(witness.id, offender.id) if offender else None
+                truth.relationship_between(witness.id, offender_id) if offender else None
             )
             closeness = str(relation.get("closeness", "stranger")) if relation else "stranger"
-            if closeness == "intimate":
-                sigma = 3.0
-            elif closeness == "acquaintance":
-                sigma = 2.0
-            else:
-                sigma = 1.5
-            time_window = fuzz_time(kill_event.timestamp, sigma=sigma, rng=witness_rng)
+            time_window = fuzz_time(
+                t0, sigma=_WITNESS_SIGMA.get(closeness, 1.5), rng=witness_rng
+            )
             confidence = confidence_from_window(time_window)
             if presence < 0.25 or visibility_score < 0.35:
                 confidence = _downgrade(confidence)
             if control_style == "intimidation":
                 confidence = _downgrade(confidence)
-            observed_person_ids = []
-            if offender and presence >= 0.25:
-                see_chance = presence * visibility_score
-                if closeness in {"intimate", "acquaintance"}:
-                    see_chance += 0.1
-                if risk_tolerance >= 0.6:
-                    see_chance += 0.1
-                if control_style == "restraints":
-                    see_chance += 0.07
-                elif control_style == "surprise":
-                    see_chance -= 0.1
-                elif control_style == "intimidation":
-                    see_chance -= 0.03
-                if exit_style == "walkaway":
-                    see_chance += 0.12
-                elif exit_style == "vehicle":
-                    see_chance -= 0.05
-                elif exit_style == "misdirection":
-                    see_chance -= 0.08
-                if cctv_available:
-                    see_chance -= 0.1
-                if witness_rng.random() < _clamp(see_chance, 0.1, 0.85):
-                    observed_person_ids.append(offender.id)
-            location_name = location.name if location else "building"
-            place = place_with_article(location_name)
+            observed_person_ids: list = []
+            if offender_visible:
+                see_chance = see_chance_by_tie[closeness in _CLOSE_TIES]
+                if witness_rng.random() < see_chance:
+                    observed_person_ids = [offender_id]
             statement = _control_statement(
                 control_style,
                 confidence,
                 place,
-                offender.name if offender else None,
+                offender_name,
                 bool(offender and observed_person_ids),
             )
             evidence.append(
@@ -779,12 +889,12 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.TESTIMONIAL,
                     summary="Witness statement",
                     source=witness.name,
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=confidence,
                     witness_id=witness.id,
                     statement=statement,
                     reported_time_window=time_window,
-                    location_id=kill_event.location_id,
+                    location_id=kill_location_id,
                     observed_person_ids=observed_person_ids,
                     uncertainty_hooks=_control_uncertainty_hooks(control_style),
                 )
@@ -804,32 +914,24 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                 evidence_type=EvidenceType.CCTV,
                 summary="CCTV report",
                 source="Traffic Control",
-                time_collected=kill_event.timestamp + 1,
+                time_collected=t1,
                 confidence=ConfidenceBand.STRONG,
                 location_id=primary_location_id,
                 observed_person_ids=list(kill_event.participants),
-                time_window=(kill_event.timestamp - 1, kill_event.timestamp + 1),
+                time_window=cctv_window,
             )
         )
         cctv_added = True
 
-    log_candidates = [
-        poi_id
-        for poi_id in poi_ids
-        if _is_log_poi(poi_id, poi_tags.get(poi_id, []))
-    ]
-    cctv_candidates = [
-        poi_id
-        for poi_id in poi_ids
-        if _is_cctv_poi(poi_id, poi_tags.get(poi_id, []))
-    ]
-    log_rng = rng.fork("scene-logs")
-    log_sources = [source for source in logs if isinstance(source, str)]
-    log_chance = min(0.85, 0.15 * len(log_sources) + float(surveillance.get("cctv", 0.0)))
+    log_candidates = [poi_id for poi_id in poi_ids if poi_kind[poi_id] & _POI_LOG]
+    cctv_candidates = [poi_id for poi_id in poi_ids if poi_kind[poi_id] & _POI_CCTV]
+    log_sources = view.log_sources
+    log_chance = min(0.85, 0.15 * len(log_sources) + view.cctv_weight)
     poi_digital_added = False
     poi_testimonial_added = False
     log_poi_id = None
     if log_candidates and (log_sources or cctv_candidates):
+        log_rng = rng.fork("scene-logs")
         omit_chance = _clamp(0.5 - log_chance, 0.05, 0.8)
         if not maybe_omit(omit_chance, log_rng):
             poi_id = log_rng.choice(log_candidates)
@@ -843,7 +945,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                 source = "Security Desk"
                 confidence = ConfidenceBand.WEAK
             time_window = fuzz_time(
-                kill_event.timestamp,
+                t0,
                 sigma=2.0,
                 rng=log_rng.fork("window"),
             )
@@ -852,7 +954,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.CCTV,
                     summary=summary,
                     source=source,
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=confidence,
                     poi_id=poi_id,
                     location_id=primary_location_id,
@@ -864,7 +966,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
             poi_digital_added = True
             log_poi_id = poi_id
 
-    weapon_items = [item for item in truth.items.values() if item.item_type == ItemType.WEAPON]
+    weapon_items = [item for item in truth.items.values() if item.item_type is ItemType.WEAPON]
     forensics_added = False
     for item in weapon_items:
         forensics_omit = _clamp(0.1 + (competence * 0.6), 0.1, 0.8)
@@ -888,7 +990,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                 evidence_type=EvidenceType.FORENSICS,
                 summary="Forensics result",
                 source="Forensics Lab",
-                time_collected=kill_event.timestamp + 2,
+                time_collected=t2,
                 confidence=ConfidenceBand.MEDIUM,
                 item_id=item.id,
                 finding=f"Trace evidence consistent with {item.name}.",
@@ -912,37 +1014,39 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
             rng.fork("contextual-lab"),
         )
         if contextual_result is not None:
-            contextual_result.time_collected = kill_event.timestamp + 2
+            contextual_result.time_collected = t2
             evidence.append(contextual_result)
             forensics_added = True
 
     if primary_poi_id:
-        body_tags = list(poi_tags.get(body_poi_id, []))
+        safe_tod = tod_poi_id or primary_poi_id
+        safe_wound = wound_poi_id or primary_poi_id
+        safe_entry = entry_poi_id or primary_poi_id
+        safe_body = body_poi_id or primary_poi_id
+        body_tags = set(poi_tagsets.get(body_poi_id, ()))
         if not body_tags and body_poi_id in poi_zone:
             zone_id = poi_zone.get(body_poi_id)
-            body_tags = list(
+            body_tags = set(
                 profiles.get("zone_templates", {})
                 .get(zone_id, {})
                 .get("tags", [])
             )
         if location and location.tags:
-            for tag in location.tags:
-                if tag not in body_tags:
-                    body_tags.append(tag)
+            body_tags.update(location.tags)
         tod_window = fuzz_time(
-            kill_event.timestamp,
+            t0,
             sigma=_tod_sigma(body_tags),
             rng=rng,
         )
-        hours_since = max(1, discovery_time - kill_event.timestamp)
+        hours_since = max(1, discovery_time - t0)
         evidence.append(
             ForensicObservation(
                 evidence_type=EvidenceType.FORENSICS,
                 summary="Forensic observation (TOD)",
                 source="Scene Unit",
-                time_collected=kill_event.timestamp + 1,
+                time_collected=t1,
                 confidence=ConfidenceBand.MEDIUM,
-                poi_id=tod_poi_id or primary_poi_id,
+                poi_id=safe_tod,
                 observation=f"Body cooling suggests death {_format_time_phrase(tod_window)}.",
                 tod_window=tod_window,
                 stage_hint=_rigor_stage(hours_since),
@@ -950,12 +1054,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
             )
         )
         wound_class = _wound_class(method_category)
-        if wound_class == "no_obvious_trauma":
-            observation = "No obvious external trauma is visible at first glance."
-        elif wound_class == "laceration":
-            observation = "Irregular tearing and tissue bridging suggest blunt trauma."
-        else:
-            observation = "Clean margins suggest a sharp instrument."
+        observation = _WOUND_OBSERVATION.get(wound_class, _SHARP_WOUND_OBSERVATION)
         control_wound = _control_wound_observation(method_category, control_style)
         if control_wound:
             observation = f"{observation} {control_wound}"
@@ -964,9 +1063,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                 evidence_type=EvidenceType.FORENSICS,
                 summary="Forensic observation (wound)",
                 source="Scene Unit",
-                time_collected=kill_event.timestamp + 1,
+                time_collected=t1,
                 confidence=ConfidenceBand.MEDIUM,
-                poi_id=wound_poi_id or primary_poi_id,
+                poi_id=safe_wound,
                 observation=observation,
                 wound_class=wound_class,
                 location_id=primary_location_id,
@@ -978,9 +1077,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (control)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.MEDIUM,
-                    poi_id=wound_poi_id or primary_poi_id,
+                    poi_id=safe_wound,
                     observation="Pressure marks and displaced fabric suggest restraint or pinning during the attack.",
                     location_id=primary_location_id,
                 )
@@ -991,9 +1090,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (control)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
-                    poi_id=wound_poi_id or primary_poi_id,
+                    poi_id=safe_wound,
                     observation="The scene suggests the victim had little chance to react before the attack escalated.",
                     location_id=primary_location_id,
                 )
@@ -1004,9 +1103,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (control)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
-                    poi_id=wound_poi_id or primary_poi_id,
+                    poi_id=safe_wound,
                     observation="Bruising and scene disruption suggest coercive force was used to dominate the encounter.",
                     location_id=primary_location_id,
                 )
@@ -1014,24 +1113,17 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
         entry_confidence = ConfidenceBand.MEDIUM
         if competence >= 0.7:
             entry_confidence = ConfidenceBand.WEAK
-        if access_path == "forced_entry":
-            entry_observation = "Scuffing and damage suggest forced entry."
-        elif access_path == "trusted_contact":
-            entry_observation = "No clear signs of forced entry; access may have been granted."
-        else:
-            entry_observation = "Entry appears routine; no immediate signs of force."
-        if approach_style == "lure" and access_path != "forced_entry":
-            entry_observation = "No clear signs of forced entry; the victim may have been drawn into routine contact."
-        elif approach_style == "ambush" and access_path != "forced_entry":
-            entry_observation = "No clear signs of forced entry; timing and surprise may have mattered more than force."
+        entry_observation = _ENTRY_OBSERVATION.get(access_path, _ROUTINE_ENTRY_OBSERVATION)
+        if access_path != "forced_entry":
+            entry_observation = _APPROACH_ENTRY_OBSERVATION.get(approach_style, entry_observation)
         evidence.append(
             ForensicObservation(
                 evidence_type=EvidenceType.FORENSICS,
                 summary="Forensic observation (entry)",
                 source="Scene Unit",
-                time_collected=kill_event.timestamp + 1,
+                time_collected=t1,
                 confidence=entry_confidence,
-                poi_id=entry_poi_id or primary_poi_id,
+                poi_id=safe_entry,
                 observation=entry_observation,
                 location_id=primary_location_id,
             )
@@ -1042,9 +1134,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (cleanup)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
-                    poi_id=entry_poi_id or primary_poi_id,
+                    poi_id=safe_entry,
                     observation="Several touched surfaces look recently wiped down.",
                     location_id=primary_location_id,
                 )
@@ -1055,9 +1147,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (cleanup)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.MEDIUM,
-                    poi_id=body_poi_id or primary_poi_id,
+                    poi_id=safe_body,
                     observation="Body position and nearby objects appear deliberately arranged after the attack.",
                     location_id=primary_location_id,
                 )
@@ -1068,9 +1160,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (cleanup)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
-                    poi_id=body_poi_id or primary_poi_id,
+                    poi_id=safe_body,
                     observation="Heat damage and soot obscure parts of the scene.",
                     location_id=primary_location_id,
                 )
@@ -1081,9 +1173,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (exit)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
-                    poi_id=entry_poi_id or primary_poi_id,
+                    poi_id=safe_entry,
                     observation="Departure traces suggest a rapid vehicle exit from the scene.",
                     location_id=primary_location_id,
                 )
@@ -1094,9 +1186,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (exit)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
-                    poi_id=entry_poi_id or primary_poi_id,
+                    poi_id=safe_entry,
                     observation="Overlapping movement cues suggest the exit path was meant to confuse direction of travel.",
                     location_id=primary_location_id,
                 )
@@ -1107,30 +1199,22 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (exit)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
-                    poi_id=entry_poi_id or primary_poi_id,
+                    poi_id=safe_entry,
                     observation="Departure traces suggest the offender left on foot and stayed exposed longer than necessary.",
                     location_id=primary_location_id,
                 )
             )
 
         extra_pois = [poi_id for poi_id in non_body_poi_ids if poi_id != entry_poi_id]
-        extra_notes = [
-            "Light scuffing suggests recent movement.",
-            "A faint smear indicates contact with a surface.",
-            "Dust displacement suggests something was moved.",
-            "Small debris points to hurried movement.",
-        ]
-        obs_rng = rng.fork("poi-trace")
-        obs_rng.shuffle(extra_pois)
+        if extra_pois:
+            obs_rng = rng.fork("poi-trace")
+            obs_rng.shuffle(extra_pois)
         for poi_id in extra_pois:
             if poi_id == log_poi_id:
                 continue
-            tags = poi_tags.get(poi_id, [])
-            if not poi_digital_added and (
-                _is_cctv_poi(poi_id, tags) or _is_log_poi(poi_id, tags)
-            ):
+            if not poi_digital_added and poi_kind.get(poi_id, 0):
                 poi_rng = obs_rng.fork(f"poi-digital:{poi_id}")
                 label = poi_rng.choice(log_sources) if log_sources else "access log"
                 summary = f"Access log ({label.replace('_', ' ').title()})"
@@ -1141,7 +1225,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     source = "Security Desk"
                     confidence = ConfidenceBand.WEAK
                 time_window = fuzz_time(
-                    kill_event.timestamp,
+                    t0,
                     sigma=2.0,
                     rng=poi_rng.fork("window"),
                 )
@@ -1150,10 +1234,10 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                         evidence_type=EvidenceType.CCTV,
                         summary=summary,
                         source=source,
-                        time_collected=kill_event.timestamp + 1,
+                        time_collected=t1,
                         confidence=confidence,
                         poi_id=poi_id,
-                        location_id=kill_event.location_id,
+                        location_id=kill_location_id,
                         observed_person_ids=[],
                         time_window=time_window,
                     )
@@ -1164,20 +1248,22 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
             if witnesses and not poi_testimonial_added and presence >= 0.35:
                 poi_rng = obs_rng.fork(f"poi-witness:{poi_id}")
                 witness = poi_rng.choice(witnesses)
-                time_window = fuzz_time(kill_event.timestamp, sigma=2.0, rng=poi_rng)
+                time_window = fuzz_time(t0, sigma=2.0, rng=poi_rng)
                 confidence = confidence_from_window(time_window)
                 if presence < 0.3 or visibility_score < 0.35:
                     confidence = _downgrade(confidence)
                 see_chance = presence * visibility_score
                 if risk_tolerance >= 0.6:
                     see_chance += 0.1
-                observed_person_ids: list = []
-                if offender and poi_rng.random() < _clamp(see_chance, 0.1, 0.75):
-                    observed_person_ids.append(offender.id)
-                poi_label = poi_labels.get(poi_id) or _poi_name(poi_id)
+                observed_person_ids = (
+                    [offender.id]
+                    if offender and poi_rng.random() < _clamp(see_chance, 0.1, 0.75)
+                    else []
+                )
+                poi_label = poi_labels.get(poi_id) or poi_names[poi_id]
                 poi_phrase = poi_label.lower()
-                heard_prefix = "I think I heard" if confidence == ConfidenceBand.WEAK else "I heard"
-                saw_prefix = "I think I saw" if confidence == ConfidenceBand.WEAK else "I saw"
+                heard_prefix = "I think I heard" if confidence is ConfidenceBand.WEAK else "I heard"
+                saw_prefix = "I think I saw" if confidence is ConfidenceBand.WEAK else "I saw"
                 statement = f"{heard_prefix} movement near the {poi_phrase}."
                 if offender and observed_person_ids:
                     statement = f"{saw_prefix} {offender.name} near the {poi_phrase}."
@@ -1186,12 +1272,12 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                         evidence_type=EvidenceType.TESTIMONIAL,
                         summary="Witness statement (scene)",
                         source=witness.name,
-                        time_collected=kill_event.timestamp + 1,
+                        time_collected=t1,
                         confidence=confidence,
                         witness_id=witness.id,
                         statement=statement,
                         reported_time_window=time_window,
-                        location_id=kill_event.location_id,
+                        location_id=kill_location_id,
                         observed_person_ids=observed_person_ids,
                         poi_id=poi_id,
                         uncertainty_hooks=["Scene-level account; no formal interview."],
@@ -1199,15 +1285,15 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                 )
                 poi_testimonial_added = True
                 continue
-            observation = obs_rng.choice(extra_notes)
+            observation = obs_rng.choice(_EXTRA_NOTES)
             evidence.append(
                 ForensicObservation(
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (trace)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
-                    poi_id=poi_id or primary_poi_id,
+                    poi_id=poi_id,
                     observation=observation,
                     location_id=primary_location_id,
                 )
@@ -1230,9 +1316,9 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (signature)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=confidence,
-                    poi_id=body_poi_id or entry_poi_id or primary_poi_id,
+                    poi_id=body_poi_id or safe_entry,
                     observation=text,
                     location_id=primary_location_id,
                 )
@@ -1258,7 +1344,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                         evidence_type=EvidenceType.FORENSICS,
                         summary="Forensic observation (scene detail)",
                         source="Scene Unit",
-                        time_collected=kill_event.timestamp + 1,
+                        time_collected=t1,
                         confidence=_pattern_confidence(observation),
                         poi_id=poi_id or primary_poi_id,
                         observation=_pattern_primary_observation(primary, observation),
@@ -1271,48 +1357,50 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                         evidence_type=EvidenceType.FORENSICS,
                         summary="Forensic observation (trace)",
                         source="Forensics Lab",
-                        time_collected=kill_event.timestamp + 2,
+                        time_collected=t2,
                         confidence=ConfidenceBand.MEDIUM,
-                        poi_id=entry_poi_id or primary_poi_id,
+                        poi_id=safe_entry,
                         observation=_pattern_support_observation(support),
                         location_id=primary_location_id,
                     )
                 )
 
-    secondary_entries = [entry for entry in location_entries if entry is not primary_entry]
+    secondary_entries = [
+        (entry, entry_id)
+        for entry, entry_id in zip(location_entries, entry_location_ids)
+        if entry is not primary_entry
+    ]
     if secondary_entries:
         offsite_rng = rng.fork("offsite")
-        for idx, entry in enumerate(secondary_entries):
-            entry_location_id = _uuid_from(entry.get("location_id"))
+        for idx, (entry, entry_location_id) in enumerate(secondary_entries):
             if not entry_location_id:
                 continue
             entry_location = truth.locations.get(entry_location_id)
             entry_layout = entry.get("scene_layout") or {}
             entry_pois = entry_layout.get("pois", []) or []
-            entry_poi_ids = [poi.get("poi_id") for poi in entry_pois if poi.get("poi_id")]
-            entry_poi_tags = {
-                poi.get("poi_id"): poi.get("tags", [])
-                for poi in entry_pois
-                if poi.get("poi_id")
-            }
-            entry_poi_labels = {
-                poi.get("poi_id"): poi.get("label")
-                for poi in entry_pois
-                if poi.get("poi_id")
-            }
+            entry_poi_ids: list[str] = []
+            entry_poi_kind: dict[str, int] = {}
+            entry_poi_labels: dict[str, Any] = {}
+            for poi in entry_pois:
+                poi_id = poi.get("poi_id")
+                if not poi_id:
+                    continue
+                entry_poi_ids.append(poi_id)
+                entry_poi_kind[poi_id] = _poi_kind(
+                    _poi_name(poi_id), frozenset(poi.get("tags") or ())
+                )
+                entry_poi_labels[poi_id] = poi.get("label")
             entry_archetype_id = entry.get("archetype_id")
-            entry_archetype = (
-                profiles["archetypes"].get(entry_archetype_id, {}) if entry_archetype_id else {}
+            entry_view = (
+                archetype_index.get(entry_archetype_id, _EMPTY_VIEW)
+                if entry_archetype_id
+                else _EMPTY_VIEW
             )
-            entry_presence_curve = entry_archetype.get("presence_curve", {}) or {}
-            entry_visibility = entry_archetype.get("visibility", {}) or {}
-            entry_surveillance = entry_archetype.get("surveillance", {}) or {}
-            entry_logs = entry_archetype.get("logs", []) or []
-            bucket = _time_bucket(kill_event.timestamp)
-            entry_presence = float(entry_presence_curve.get(bucket, 0.35))
-            noise = float(entry_visibility.get("noise", 0.4))
+            entry_logs = entry_view.logs
+            entry_presence = float(entry_view.presence_curve.get(bucket, 0.35))
+            noise = float(entry_view.visibility.get("noise", 0.4))
             witness_weight = max(0.05, entry_presence * (1.0 - noise))
-            cctv_weight = float(entry_surveillance.get("cctv", 0.0))
+            cctv_weight = entry_view.cctv_weight
             logs_weight = min(0.8, 0.2 + (0.1 * len(entry_logs))) if entry_logs else 0.0
             if exit_style == "vehicle":
                 cctv_weight += 0.2
@@ -1326,14 +1414,10 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
             )
             if choice in {"cctv", "logs"}:
                 log_candidates = [
-                    poi_id
-                    for poi_id in entry_poi_ids
-                    if _is_log_poi(poi_id, entry_poi_tags.get(poi_id, []))
+                    poi_id for poi_id in entry_poi_ids if entry_poi_kind[poi_id] & _POI_LOG
                 ]
                 cctv_candidates = [
-                    poi_id
-                    for poi_id in entry_poi_ids
-                    if _is_cctv_poi(poi_id, entry_poi_tags.get(poi_id, []))
+                    poi_id for poi_id in entry_poi_ids if entry_poi_kind[poi_id] & _POI_CCTV
                 ]
                 entry_poi_id = None
                 if choice == "logs" and log_candidates:
@@ -1353,7 +1437,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     source = "Facility Log"
                     confidence = ConfidenceBand.MEDIUM
                 time_window = fuzz_time(
-                    kill_event.timestamp + offsite_rng.randint(-2, 2),
+                    t0 + offsite_rng.randint(-2, 2),
                     sigma=2.5,
                     rng=offsite_rng.fork(f"window:{idx}"),
                 )
@@ -1362,7 +1446,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                         evidence_type=EvidenceType.CCTV,
                         summary=summary,
                         source=source,
-                        time_collected=kill_event.timestamp + 1,
+                        time_collected=t1,
                         confidence=confidence,
                         location_id=entry_location_id,
                         observed_person_ids=[],
@@ -1376,7 +1460,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
             if choice == "witness" and witnesses:
                 witness = offsite_rng.choice(witnesses)
                 time_window = fuzz_time(
-                    kill_event.timestamp + offsite_rng.randint(-2, 2),
+                    t0 + offsite_rng.randint(-2, 2),
                     sigma=2.5,
                     rng=offsite_rng.fork(f"witness-window:{idx}"),
                 )
@@ -1385,19 +1469,18 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     confidence = _downgrade(confidence)
                 place = place_with_article(entry_location.name if entry_location else "location")
                 statement = f"I heard activity near {place}."
-                observed_person_ids: list = []
                 evidence.append(
                     WitnessStatement(
                         evidence_type=EvidenceType.TESTIMONIAL,
                         summary="Witness statement (off-site)",
                         source=witness.name,
-                        time_collected=kill_event.timestamp + 1,
+                        time_collected=t1,
                         confidence=confidence,
                         witness_id=witness.id,
                         statement=statement,
                         reported_time_window=time_window,
                         location_id=entry_location_id,
-                        observed_person_ids=observed_person_ids,
+                        observed_person_ids=[],
                         poi_id=None,
                         uncertainty_hooks=["Off-site account; limited context."],
                     )
@@ -1412,7 +1495,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensic observation (off-site)",
                     source="Scene Unit",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
                     poi_id=entry_poi_id,
                     observation=f"Scene note from the {label_text.lower()}.",
@@ -1427,11 +1510,11 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.CCTV,
                     summary="CCTV report (partial)",
                     source="Traffic Control",
-                    time_collected=kill_event.timestamp + 1,
+                    time_collected=t1,
                     confidence=ConfidenceBand.WEAK,
                 location_id=primary_location_id,
                 observed_person_ids=list(kill_event.participants),
-                time_window=(kill_event.timestamp - 2, kill_event.timestamp + 2),
+                time_window=cctv_partial_window,
             )
         )
         elif weapon_items:
@@ -1442,7 +1525,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
                     evidence_type=EvidenceType.FORENSICS,
                     summary="Forensics result (partial)",
                     source="Forensics Lab",
-                    time_collected=kill_event.timestamp + 2,
+                    time_collected=t2,
                     confidence=ConfidenceBand.WEAK,
                     item_id=item.id,
                     finding=f"Partial trace evidence consistent with {item.name}.",
@@ -1458,7 +1541,7 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
         evidence,
         primary_location_id,
         primary_location.name if primary_location else "the scene",
-        kill_event.timestamp,
+        t0,
         rng.fork("real-suspect"),
     )
     _reinforce_real_suspect_trail(
@@ -1466,14 +1549,14 @@ def project_case(truth: TruthState, rng: Rng) -> PresentationCase:
         evidence,
         primary_location_id,
         primary_location.name if primary_location else "the scene",
-        kill_event.timestamp,
+        t0,
     )
     _inject_false_lead(
         truth,
         evidence,
         primary_location_id,
         primary_location.name if primary_location else "the scene",
-        kill_event.timestamp,
+        t0,
         rng.fork("false-lead"),
     )
 
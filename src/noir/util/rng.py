@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 import hashlib
+from itertools import accumulate
 import random
 from typing import Iterable, Sequence, TypeVar
 
@@ -42,13 +44,10 @@ class Rng:
 
     def weighted_choice(self, items: Iterable[tuple[T, float]]) -> T:
         items_list = list(items)
-        total = sum(weight for _, weight in items_list)
+        weights = [weight for _, weight in items_list]
+        total = sum(weights)
         if total <= 0:
             raise ValueError("weighted_choice requires positive total weight")
         pick = self._random.random() * total
-        cumulative = 0.0
-        for value, weight in items_list:
-            cumulative += weight
-            if pick <= cumulative:
-                return value
-        return items_list[-1][0]
+        index = bisect_left(list(accumulate(weights)), pick)
+        return items_list[min(index, len(items_list) - 1)][0]
@@ -0,0 +1,61 @@
+from noir.narrative.recaps import build_episode_title
+from noir.util.rng import Rng
+from noir.world.state import EpisodeTitleState
+
+
+def test_build_episode_title_skips_ids_used_in_title_state() -> None:
+    first = EpisodeTitleState()
+    first_titles = [
+        build_episode_title(Rng(seed), "Pier 9", "harbor", title_state=first)
+        for seed in range(10)
+    ]
+    assert len(set(first_titles)) == 10
+    assert len(set(first.used_ids)) == 10
+
+    second = EpisodeTitleState(used_ids=list(first.used_ids))
+    for seed in range(10):
+        title = build_episode_title(Rng(seed), "Pier 9", "harbor", title_state=second)
+        assert title not in first_titles
+
+
+def test_build_episode_title_reads_recency_windows_from_title_state() -> None:
+    def register_b_picks(recent: list[str]) -> int:
+        picks = 0
+        for seed in range(200):
+            state = EpisodeTitleState(recent_registers=list(recent))
+            build_episode_title(Rng(seed), "Pier 9", "harbor", title_state=state)
+            picks += state.recent_registers[-1] == "B"
+        return picks
+
+    assert register_b_picks(["A", "A", "A"]) > register_b_picks(["B", "B", "B"])
+
+    state = EpisodeTitleState()
+    for seed in range(12):
+        build_episode_title(Rng(seed), "Pier 9", "harbor", title_state=state)
+    assert len(state.recent_registers) == 3
+    assert len(state.recent_tags) == 8
+
+
+def test_exhausted_title_pool_keeps_nemesis_only_titles_for_nemesis_episodes() -> None:
+    nemesis_only = {"All the Devils Are Here", "The Pattern Has a Name"}
+    exhausted = list(range(128))
+
+    for kind in ("normal", "copycat", "opener", "finale"):
+        for seed in range(60):
+            state = EpisodeTitleState(used_ids=list(exhausted))
+            title = build_episode_title(
+                Rng(seed), "Pier 9", "harbor", episode_kind=kind, title_state=state
+            )
+            assert title not in nemesis_only
+
+    nemesis_titles = {
+        build_episode_title(
+            Rng(seed),
+            "Pier 9",
+            "harbor",
+            episode_kind="nemesis",
+            title_state=EpisodeTitleState(used_ids=list(exhausted)),
+        )
+        for seed in range(60)
+    }
+    assert nemesis_titles & nemesis_only
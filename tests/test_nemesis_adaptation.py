@@ -1,5 +1,7 @@
 from uuid import uuid4
 
+import pytest
+
 from noir.domain.enums import ConfidenceBand, EvidenceType
 from noir.investigation.costs import ActionType
 from noir.investigation.runtime import apply_runtime_rules
@@ -77,6 +79,28 @@ def _state() -> NemesisState:
 	)
 
 
+def test_components_by_type_matches_frozen_component_tuple() -> None:
+	state = _state()
+
+	assert isinstance(state.mo_components, tuple)
+	methods = state.components_by_type[NemesisComponentType.METHOD.value]
+	assert [comp.value for comp in methods] == ["sharp", "blunt", "poison"]
+	restored = NemesisState.from_dict(state.to_dict())
+	assert restored.components_by_type.keys() == state.components_by_type.keys()
+
+
+def test_from_dict_rejects_unknown_typology_and_component_type() -> None:
+	payload = _state().to_dict()
+	payload["profile"]["typology"] = "renamed_typology"
+	with pytest.raises(ValueError):
+		NemesisState.from_dict(payload)
+
+	payload = _state().to_dict()
+	payload["mo_components"][0]["component_type"] = "renamed_component"
+	with pytest.raises(ValueError):
+		NemesisState.from_dict(payload)
+
+
 def test_plan_nemesis_case_carries_full_component_vector() -> None:
 	state = _state()
 
@@ -1,4 +1,9 @@
-from uuid import uuid4
+from dataclasses import dataclass, field
+import json
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+import pytest
 
 from noir.deduction.board import ClaimType, Hypothesis, ReasoningStep
 from noir.domain.enums import RoleTag
@@ -15,7 +20,14 @@ from noir.persistence.save_load import (
     restore_saved_hypothesis,
     save_investigation,
 )
-from noir.presentation.evidence import PresentationCase, WitnessStatement
+from noir.presentation.evidence import (
+    CCTVReport,
+    EvidenceItem,
+    ForensicObservation,
+    ForensicsResult,
+    PresentationCase,
+    WitnessStatement,
+)
 from noir.profiling.profile import OffenderProfile, ProfileDrive, ProfileMobility, ProfileOrganization
 from noir.truth.graph import TruthState
 
@@ -240,4 +252,121 @@ def test_restore_saved_hypothesis_clears_unmigratable_state() -> None:
 
     assert restored is None
     assert note is not None
-    assert "cleared" in note.lower()
\ No newline at end of file
+    assert "cleared" in note.lower()
+
+
+def test_evidence_from_dict_rejects_unknown_fields() -> None:
+    statement = WitnessStatement(
+        evidence_type=EvidenceType.TESTIMONIAL,
+        summary="Witness statement",
+        source="Interview",
+        time_collected=2,
+        confidence=ConfidenceBand.MEDIUM,
+        witness_id=uuid4(),
+        statement="I saw someone at the door.",
+        reported_time_window=(20, 21),
+        location_id=uuid4(),
+    )
+    payload = statement.to_dict()
+
+    assert WitnessStatement.from_dict(payload) == statement
+    payload["mood"] = "tense"
+    with pytest.raises(ValueError):
+        WitnessStatement.from_dict(payload)
+
+
+def _evidence_base(evidence_type: EvidenceType) -> dict:
+    return {
+        "evidence_type": evidence_type,
+        "summary": "Summary",
+        "source": "Source",
+        "time_collected": 4,
+        "confidence": ConfidenceBand.WEAK,
+        "poi_id": "primary|room:door:0",
+    }
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        WitnessStatement(
+            **_evidence_base(EvidenceType.TESTIMONIAL),
+            witness_id=uuid4(),
+            statement="I saw someone at the door.",
+            reported_time_window=(20, 21),
+            location_id=uuid4(),
+            observed_person_ids=[uuid4(), uuid4()],
+            uncertainty_hooks=["It was dark."],
+        ),
+        CCTVReport(
+            **_evidence_base(EvidenceType.CCTV),
+            location_id=uuid4(),
+            observed_person_ids=[uuid4()],
+            time_window=(18, 19),
+        ),
+        ForensicsResult(
+            **_evidence_base(EvidenceType.FORENSICS),
+            item_id=uuid4(),
+            finding="Prints match.",
+            method="latent prints",
+            method_category="trace",
+            location_id=uuid4(),
+        ),
+        ForensicsResult(
+            **_evidence_base(EvidenceType.FORENSICS),
+            item_id=uuid4(),
+            finding="No usable prints.",
+            method="latent prints",
+            method_category="trace",
+        ),
+        ForensicObservation(
+            **_evidence_base(EvidenceType.FORENSICS),
+            observation="Lividity is fixed.",
+            tod_window=(1, 3),
+            wound_class="blunt",
+            stage_hint="moved",
+            location_id=uuid4(),
+        ),
+        ForensicObservation(
+            **_evidence_base(EvidenceType.FORENSICS),
+            observation="Scene is too disturbed to read.",
+        ),
+    ],
+)
+def test_evidence_round_trips_through_json(item: EvidenceItem) -> None:
+    payload = json.loads(json.dumps(item.to_dict()))
+
+    restored = type(item).from_dict(payload)
+
+    assert restored == item
+    assert isinstance(restored.id, UUID)
+    for name in ("location_id", "witness_id", "item_id"):
+        value = getattr(restored, name, None)
+        assert value is None or isinstance(value, UUID)
+    for name in ("reported_time_window", "time_window", "tod_window"):
+        value = getattr(restored, name, None)
+        assert value is None or isinstance(value, tuple)
+
+
+@dataclass(slots=True, kw_only=True)
+class _AliasedEvidence(EvidenceItem):
+    person_ids: List[UUID] = field(default_factory=list)
+    window: tuple[int, int] = (0, 0)
+    location_id: Optional[UUID] = None
+
+
+def test_evidence_from_dict_decodes_typing_aliases() -> None:
+    item = _AliasedEvidence(
+        **_evidence_base(EvidenceType.CCTV),
+        person_ids=[uuid4()],
+        window=(5, 6),
+        location_id=uuid4(),
+    )
+    payload = json.loads(json.dumps(item.to_dict()))
+
+    restored = _AliasedEvidence.from_dict(payload)
+
+    assert restored == item
+    assert isinstance(restored.person_ids[0], UUID)
+    assert restored.window == (5, 6)
+    assert isinstance(restored.location_id, UUID)
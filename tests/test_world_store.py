@@ -1,5 +1,7 @@
+from noir.nemesis.state import create_nemesis_state
 from noir.persistence.db import WorldStore
-from noir.world.state import CaseRecord
+from noir.util.rng import Rng
+from noir.world.state import CaseRecord, DistrictStatus, PersonRecord
 
 
 def test_load_world_state_initializes_row_without_losing_existing_records(tmp_path) -> None:
@@ -79,4 +81,152 @@ def test_world_store_persists_nemesis_dossier_entries(tmp_path) -> None:
     assert entry.case_id == "case_002"
     assert entry.headline == "Pattern Worth Monitoring"
     assert any("pressed flower" in note for note in entry.notes)
-    store.close()
\ No newline at end of file
+    store.close()
+
+
+def test_save_world_state_round_trips_status_and_people_rows(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    store = WorldStore(path)
+    state = store.load_world_state()
+    state.district_status["harbor"] = DistrictStatus.TENSE
+    state.location_status["Pier 9"] = DistrictStatus.VOLATILE
+    state.people_index["person-2"] = PersonRecord(
+        person_id="person-2",
+        name="Ada Crane",
+        role_tag="witness",
+        country_of_origin=None,
+        religion_affiliation=None,
+        religion_observance=None,
+        community_connectedness=None,
+        created_in_case_id="case_003",
+        last_seen_case_id="case_003",
+        last_seen_tick=5,
+    )
+    store.save_world_state(state)
+    store.save_world_state(state)
+
+    reloaded = store.load_world_state()
+
+    assert reloaded.district_status == {"harbor": DistrictStatus.TENSE}
+    assert reloaded.location_status == {"Pier 9": DistrictStatus.VOLATILE}
+    assert reloaded.people_index == state.people_index
+    store.close()
+
+
+def test_save_world_state_round_trips_episode_title_state(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    store = WorldStore(path)
+    state = store.load_world_state()
+    state.episode_titles.used_ids.extend([3, 17])
+    state.episode_titles.recent_registers.append("noir")
+    state.episode_titles.recent_tags.extend(["harbor", "night"])
+    store.save_world_state(state)
+
+    reloaded = store.load_world_state()
+
+    assert reloaded.episode_titles.used_ids == [3, 17]
+    assert reloaded.episode_titles.recent_registers == ["noir"]
+    assert reloaded.episode_titles.recent_tags == ["harbor", "night"]
+
+    state.episode_titles.used_ids.append(21)
+    store.save_world_state(state)
+
+    assert store.load_world_state().episode_titles.used_ids == [3, 17, 21]
+    store.close()
+
+
+def test_load_world_state_reads_legacy_pipe_joined_case_notes(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    store = WorldStore(path)
+    store.record_case(
+        CaseRecord(
+            case_id="case_010",
+            seed=10,
+            district="harbor",
+            started_tick=0,
+            ended_tick=2,
+            outcome="solved",
+            trust_delta=1,
+            pressure_delta=0,
+            notes=["Alibi | checked twice.", "Pier lights out."],
+        )
+    )
+    store.conn.execute(
+        "UPDATE case_history SET notes = ? WHERE case_id = ?",
+        ("Old note one | Old note two", "case_010"),
+    )
+    store.conn.commit()
+    legacy = store.load_world_state()
+    assert legacy.case_history[0].notes == ["Old note one", "Old note two"]
+
+    store.conn.execute("DELETE FROM case_history")
+    store.conn.commit()
+    store.record_case(
+        CaseRecord(
+            case_id="case_011",
+            seed=11,
+            district="harbor",
+            started_tick=0,
+            ended_tick=2,
+            outcome="solved",
+            trust_delta=1,
+            pressure_delta=0,
+            notes=["Alibi | checked twice.", "Pier lights out."],
+        )
+    )
+    current = store.load_world_state()
+    assert current.case_history[0].notes == ["Alibi | checked twice.", "Pier lights out."]
+    store.close()
+
+
+def test_save_world_state_skips_tables_that_did_not_change(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    store = WorldStore(path)
+    state = store.load_world_state()
+    state.district_status["harbor"] = DistrictStatus.TENSE
+    store.save_world_state(state)
+    changes_after_first_save = store.conn.total_changes
+
+    store.save_world_state(state)
+    assert store.conn.total_changes == changes_after_first_save
+
+    state.trust += 1
+    store.save_world_state(state)
+    assert store.conn.total_changes == changes_after_first_save + 1
+    assert store.load_world_state().trust == state.trust
+    store.close()
+
+
+def test_save_world_state_clears_nemesis_row_after_load(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    store = WorldStore(path)
+    state = store.load_world_state()
+    state.nemesis_state = create_nemesis_state(Rng(91))
+    store.save_world_state(state)
+
+    reloaded = store.load_world_state()
+    assert reloaded.nemesis_state is not None
+    reloaded.nemesis_state = None
+    store.save_world_state(reloaded)
+
+    assert store.conn.execute("SELECT COUNT(*) FROM nemesis_state").fetchone()[0] == 0
+    assert store.load_world_state().nemesis_state is None
+    store.close()
+
+
+def test_save_world_state_rewrites_rows_changed_by_another_store(tmp_path) -> None:
+    path = tmp_path / "world.db"
+    first = WorldStore(path)
+    second = WorldStore(path)
+    state = first.load_world_state()
+    state.trust = 1
+    first.save_world_state(state)
+
+    other = second.load_world_state()
+    other.trust = 2
+    second.save_world_state(other)
+    first.save_world_state(state)
+
+    assert second.load_world_state().trust == 1
+    first.close()
+    second.close()